@@ -3,6 +3,7 @@ Resilient gRPC Client with Circuit Breaker, Retry, and Adaptive Timeout
 Phase 3: Full Resilience Support
 """
 
+import json
 import logging
 import os
 import sys
@@ -46,6 +47,9 @@ class ResilienceConfig:
     retry_max_attempts: int = 4
     retry_initial_backoff: float = 1.0
     retry_max_backoff: float = 30.0
+    # 가능하면 재시도를 gRPC C-core 에 맡김 (서비스 설정 retryPolicy)
+    # 주의: 코어 재시도는 전체 호출에 하나의 deadline 을 적용함
+    retry_native: bool = False
 
     adaptive_timeout_enabled: bool = True
     default_timeout: float = 30.0
@@ -74,6 +78,7 @@ class ResilientGrpcClient:
         self._timeout_manager: TimeoutManager | None = None
         self._fallback_manager: FallbackManager | None = None
         self._interceptors: list[grpc.aio.ClientInterceptor] = []
+        self._service_config: dict | None = None
 
         self._setup_resilience()
 
@@ -94,7 +99,10 @@ class ResilientGrpcClient:
                 initial_backoff=res.retry_initial_backoff,
                 max_backoff=res.retry_max_backoff,
             )
-            self._interceptors.append(RetryInterceptor(retry_policy))
+            if res.retry_native:
+                self._service_config = retry_policy.to_service_config()
+            if self._service_config is None:
+                self._interceptors.append(RetryInterceptor(retry_policy))
 
         if res.adaptive_timeout_enabled:
             timeout_config = TimeoutConfig(default_timeout=res.default_timeout)
@@ -123,6 +131,8 @@ class ResilientGrpcClient:
                 ("grpc.keepalive_time_ms", 30000),
                 ("grpc.keepalive_timeout_ms", 10000),
             ]
+            if self._service_config is not None:
+                options.append(("grpc.service_config", json.dumps(self._service_config)))
 
             compression = (
                 grpc.Compression.Gzip if self.config.compression else grpc.Compression.NoCompression
@@ -102,8 +102,8 @@ class TcpClient:
         async with self._lock:
             try:
                 # 요청 전송
-                data = MessageFramer.encode(request.to_dict())
-                self.writer.write(data)
+                header, payload = MessageFramer.encode_parts(request.to_dict())
+                self.writer.writelines((header, payload))
                 await self.writer.drain()
 
                 # 응답 수신
@@ -7,6 +7,7 @@ import contextlib
 import logging
 import signal
 import sys
+import weakref
 from abc import ABC, abstractmethod
 from collections.abc import Callable
 from datetime import datetime
@@ -22,6 +23,12 @@ from .protocol import (
 # 타입 별칭
 MethodHandler = Callable[[dict[str, Any]], Any]
 
+# 종료 시 연결 정리 최대 대기 시간 (초)
+SHUTDOWN_TIMEOUT = 5.0
+
+# 핸들러 결과로 허용되는 직렬화 가능 타입
+_SIMPLE_TYPES = frozenset({dict, list, tuple, str, int, float, bool, type(None)})
+
 
 class ServiceProtocol:
     """서비스 프로토콜 인터페이스"""
@@ -50,7 +57,9 @@ class BaseService(ABC):
         # 상태
         self.server: asyncio.Server | None = None
         self.start_time: datetime | None = None
-        self.connections: set[asyncio.StreamWriter] = set()
+        # 닫힌 writer 는 자동으로 제거됨 (연결 누수 방지)
+        self.connections: weakref.WeakSet[asyncio.StreamWriter] = weakref.WeakSet()
+        self._active_connections = 0
         self._running = False
 
         # 메서드 핸들러 레지스트리
@@ -80,7 +89,8 @@ class BaseService(ABC):
     def register_handler(self, method: str, handler: MethodHandler):
         """메서드 핸들러 등록"""
         self._handlers[method] = handler
-        self.logger.debug(f"Registered handler: {method}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Registered handler: %s", method)
 
     async def _handle_health(self, params: dict[str, Any]) -> dict[str, Any]:
         """헬스 체크 핸들러"""
@@ -94,7 +104,7 @@ class BaseService(ABC):
             "host": self.host,
             "port": self.port,
             "uptime_seconds": int(uptime),
-            "connections": len(self.connections),
+            "connections": self._active_connections,
             "timestamp": datetime.now().isoformat(),
         }
 
@@ -149,12 +159,18 @@ class BaseService(ABC):
         self.logger.info("Shutting down...")
         self._running = False
 
-        # 모든 연결 종료
-        for writer in list(self.connections):
+        # 모든 연결 병렬 종료 (응답 없는 피어 대비 최대 대기 시간 제한)
+        async def _close(writer: asyncio.StreamWriter):
             writer.close()
             with contextlib.suppress(Exception):
                 await writer.wait_closed()
 
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(
+                asyncio.gather(*(_close(w) for w in tuple(self.connections))),
+                timeout=SHUTDOWN_TIMEOUT,
+            )
+
         if self.server:
             self.server.close()
             await self.server.wait_closed()
@@ -170,7 +186,8 @@ class BaseService(ABC):
         addr = writer.get_extra_info("peername")
         conn_id = f"{addr[0]}:{addr[1]}" if addr else "unknown"
         self.connections.add(writer)
-        self.logger.info(f"Client connected: {conn_id}")
+        self._active_connections += 1
+        self.logger.info("Client connected: %s", conn_id)
 
         try:
             while self._running:
@@ -181,14 +198,14 @@ class BaseService(ABC):
                         timeout=300.0,  # 5분 타임아웃
                     )
                 except TimeoutError:
-                    self.logger.debug(f"Connection timeout: {conn_id}")
+                    self.logger.debug("Connection timeout: %s", conn_id)
                     break
 
                 msg_length = MessageFramer.decode_header(header)
 
                 # 메시지 크기 검증
                 if msg_length > MessageFramer.MAX_MESSAGE_SIZE:
-                    self.logger.error(f"Message too large: {msg_length}")
+                    self.logger.error("Message too large: %d", msg_length)
                     await self._send_error(
                         writer, "", ErrorCode.INVALID_REQUEST, "Message too large"
                     )
@@ -198,29 +215,32 @@ class BaseService(ABC):
                 payload = await reader.readexactly(msg_length)
                 request_data = MessageFramer.decode_payload(payload)
 
-                # 요청 처리
-                request = JsonRpcRequest.from_dict(request_data)
-                response = await self._process_request(request)
+                # 요청 처리 (요청 객체는 free-list 에서 재사용)
+                request = JsonRpcRequest.acquire(request_data)
+                try:
+                    response = await self._process_request(request)
+                finally:
+                    JsonRpcRequest.release(request)
 
                 # 응답 전송
                 await self._send_response(writer, response)
 
         except asyncio.IncompleteReadError:
-            self.logger.info(f"Client disconnected: {conn_id}")
+            self.logger.info("Client disconnected: %s", conn_id)
         except ConnectionResetError:
-            self.logger.info(f"Connection reset: {conn_id}")
+            self.logger.info("Connection reset: %s", conn_id)
         except Exception as e:
-            self.logger.error(f"Error handling {conn_id}: {e}")
+            self.logger.error("Error handling %s: %s", conn_id, e)
         finally:
-            self.connections.discard(writer)
+            self._active_connections -= 1
             writer.close()
             with contextlib.suppress(Exception):
                 await writer.wait_closed()
-            self.logger.debug(f"Connection closed: {conn_id}")
+            self.logger.debug("Connection closed: %s", conn_id)
 
     async def _process_request(self, request: JsonRpcRequest) -> JsonRpcResponse:
         """요청 처리"""
-        self.logger.debug(f"Processing: {request.method} (id={request.id})")
+        self.logger.debug("Processing: %s (id=%s)", request.method, request.id)
 
         handler = self._handlers.get(request.method)
         if not handler:
@@ -238,18 +258,16 @@ class BaseService(ABC):
             if asyncio.iscoroutine(result):
                 result = await result
 
-            # 결과 검증
-            if callable(result) and not isinstance(
-                result, (dict, list, str, int, float, bool, type(None))
-            ):
-                self.logger.warning(f"Handler returned callable: {type(result)}")
+            # 결과 검증 (python -O 실행 시 생략)
+            if __debug__ and callable(result) and type(result) not in _SIMPLE_TYPES:
+                self.logger.warning("Handler returned callable: %s", type(result))
                 result = {"error": "Handler returned invalid type"}
 
             response = JsonRpcResponse.success(request.id, result)
             return response
 
         except Exception as e:
-            self.logger.error(f"Handler error: {e}", exc_info=True)
+            self.logger.error("Handler error: %s", e, exc_info=True)
             return JsonRpcResponse.create_error(
                 request.id,
                 ErrorCode.INTERNAL_ERROR,
@@ -261,17 +279,16 @@ class BaseService(ABC):
         try:
             # 타입 체크
             if not isinstance(response, JsonRpcResponse):
-                self.logger.error(f"Invalid response type: {type(response)}")
+                self.logger.error("Invalid response type: %s", type(response))
                 response = JsonRpcResponse.create_error(
                     "", ErrorCode.INTERNAL_ERROR, "Invalid response type"
                 )
 
-            response_dict = response.to_dict()
-            data = MessageFramer.encode(response_dict)
-            writer.write(data)
+            header, payload = MessageFramer.encode_parts(response.to_bytes())
+            writer.writelines((header, payload))
             await writer.drain()
         except Exception as e:
-            self.logger.error(f"Failed to send response: {e}", exc_info=True)
+            self.logger.error("Failed to send response: %s", e, exc_info=True)
 
     async def _send_error(
         self,
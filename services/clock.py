@@ -0,0 +1,22 @@
+"""
+타임스탬프 헬퍼
+응답마다 생성하는 ISO 타임스탬프 문자열을 1ms 단위로 재사용
+"""
+
+import time
+from datetime import datetime
+
+# 마지막으로 포맷한 밀리초와 해당 ISO 문자열
+_cached_ms = -1
+_cached_iso = ""
+
+
+def now_iso() -> str:
+    """현재 시각 ISO 문자열 (밀리초 정밀도, 같은 밀리초 안에서는 캐시된 문자열 반환)"""
+    global _cached_ms, _cached_iso
+    t = time.time()
+    ms = int(t * 1000)
+    if ms != _cached_ms:
+        _cached_iso = datetime.fromtimestamp(ms / 1000).isoformat(timespec="milliseconds")
+        _cached_ms = ms
+    return _cached_iso
@@ -5,11 +5,42 @@ Codex 서비스 - Executor 역할
 
 import asyncio
 import os
+import time
 from datetime import datetime
 from typing import Any
 
 from .base_service import BaseService
 
+# 출력 스트림 읽기 단위 및 최대 보관 크기
+STREAM_CHUNK_SIZE = 64 * 1024
+MAX_OUTPUT_SIZE = 4 * 1024 * 1024  # 4MB
+TRUNCATED_MARKER = "...[truncated]"
+
+_now = datetime.now
+
+
+async def _drain(stream: asyncio.StreamReader | None, buf: bytearray) -> bool:
+    """스트림을 버퍼로 점진적으로 읽기 (최대 크기 초과분은 버림)
+
+    Returns:
+        출력이 잘렸는지 여부
+    """
+    truncated = False
+    if stream is None:
+        return truncated
+
+    while chunk := await stream.read(STREAM_CHUNK_SIZE):
+        remaining = MAX_OUTPUT_SIZE - len(buf)
+        if remaining <= 0:
+            truncated = True
+            continue
+        if len(chunk) > remaining:
+            truncated = True
+            chunk = chunk[:remaining]
+        buf.extend(chunk)
+
+    return truncated
+
 
 class CodexService(BaseService):
     """Codex AI 에이전트 서비스 (Executor)"""
@@ -65,7 +96,7 @@ class CodexService(BaseService):
 
         return {
             "output": f"[Codex] Executor ready for: {task}",
-            "processed_at": datetime.now().isoformat(),
+            "processed_at": _now().isoformat(),
             "agent": "codex",
             "sandbox_mode": self.sandbox_mode,
         }
@@ -96,7 +127,7 @@ class CodexService(BaseService):
             "stdout": result["stdout"],
             "stderr": result["stderr"],
             "duration_seconds": result["duration"],
-            "executed_at": datetime.now().isoformat(),
+            "executed_at": _now().isoformat(),
         }
 
     def _validate_command(self, command: str) -> dict[str, Any]:
@@ -152,9 +183,11 @@ class CodexService(BaseService):
         env: dict[str, str],
     ) -> dict[str, Any]:
         """명령 실행"""
-        import time
+        perf_counter = time.perf_counter
+        create_subprocess = asyncio.create_subprocess_shell
+        pipe = asyncio.subprocess.PIPE
 
-        start_time = time.perf_counter()
+        start_time = perf_counter()
 
         # 환경 변수 설정
         process_env = os.environ.copy()
@@ -162,20 +195,28 @@ class CodexService(BaseService):
 
         try:
             # 비동기로 프로세스 실행
-            process = await asyncio.create_subprocess_shell(
+            process = await create_subprocess(
                 command,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+                stdout=pipe,
+                stderr=pipe,
                 cwd=working_dir,
                 env=process_env,
             )
 
+            stdout_buf = bytearray()
+            stderr_buf = bytearray()
+
             try:
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(),
+                # stdout/stderr 를 동시에 점진적으로 읽기 (전체 출력 버퍼링 방지)
+                # 파이프를 먼저 닫고 계속 실행되는 프로세스도 제한되도록 wait() 까지 타임아웃에 포함
+                stdout_truncated, stderr_truncated, exit_code = await asyncio.wait_for(
+                    asyncio.gather(
+                        _drain(process.stdout, stdout_buf),
+                        _drain(process.stderr, stderr_buf),
+                        process.wait(),
+                    ),
                     timeout=timeout,
                 )
-                exit_code = process.returncode
 
             except TimeoutError:
                 process.kill()
@@ -187,12 +228,17 @@ class CodexService(BaseService):
                     "duration": timeout,
                 }
 
-            duration = time.perf_counter() - start_time
+            duration = perf_counter() - start_time
+
+            stdout = stdout_buf.decode("utf-8", errors="replace")
+            stderr = stderr_buf.decode("utf-8", errors="replace")
+            if stdout_truncated or stderr_truncated:
+                stderr += TRUNCATED_MARKER
 
             return {
                 "exit_code": exit_code,
-                "stdout": stdout.decode("utf-8", errors="replace"),
-                "stderr": stderr.decode("utf-8", errors="replace"),
+                "stdout": stdout,
+                "stderr": stderr,
                 "duration": round(duration, 3),
             }
 
@@ -201,7 +247,7 @@ class CodexService(BaseService):
                 "exit_code": -1,
                 "stdout": "",
                 "stderr": str(e),
-                "duration": time.perf_counter() - start_time,
+                "duration": perf_counter() - start_time,
             }
 
     async def _handle_build(self, params: dict[str, Any]) -> dict[str, Any]:
@@ -221,7 +267,7 @@ class CodexService(BaseService):
             "stdout": result["stdout"],
             "stderr": result["stderr"],
             "duration_seconds": result["duration"],
-            "built_at": datetime.now().isoformat(),
+            "built_at": _now().isoformat(),
         }
 
     async def _handle_test(self, params: dict[str, Any]) -> dict[str, Any]:
@@ -248,7 +294,7 @@ class CodexService(BaseService):
             "errors": result["stderr"],
             "test_results": test_results,
             "duration_seconds": result["duration"],
-            "tested_at": datetime.now().isoformat(),
+            "tested_at": _now().isoformat(),
         }
 
     def _parse_test_output(self, output: str) -> dict[str, Any]:
@@ -280,7 +326,7 @@ class CodexService(BaseService):
                     "4. Deploy to target",
                     "5. Health check",
                 ],
-                "deployed_at": datetime.now().isoformat(),
+                "deployed_at": _now().isoformat(),
             }
 
         return {
@@ -288,7 +334,7 @@ class CodexService(BaseService):
             "target": target,
             "dry_run": False,
             "message": "Deployment initiated (simulated)",
-            "deployed_at": datetime.now().isoformat(),
+            "deployed_at": _now().isoformat(),
         }
 
 
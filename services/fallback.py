@@ -9,29 +9,42 @@ Phase 3: Resilience
 """
 
 import asyncio
+import hashlib
 import logging
+import pickle
 import time
 from abc import ABC, abstractmethod
 from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any, Generic, TypeVar
 
+from google.protobuf.message import Message
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - 선택 의존성
+    ahocorasick = None
+
+try:
+    import xxhash
+except ImportError:  # pragma: no cover - 선택 의존성
+    xxhash = None
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheEntry(Generic[T]):
-    """캐시 엔트리"""
+    """캐시 엔트리 (만료 시각은 time.monotonic() 기준 절대값)"""
 
     value: T
-    timestamp: float
-    ttl: float
+    expires_at: float
 
     @property
     def is_expired(self) -> bool:
-        return time.time() - self.timestamp > self.ttl
+        return time.monotonic() > self.expires_at
 
 
 @dataclass
@@ -52,10 +65,28 @@ class FallbackCache:
         self._cache: dict[str, CacheEntry] = {}
         self._lock = asyncio.Lock()
 
+    @staticmethod
+    def _request_bytes(request: Any) -> bytes | bytearray | memoryview:
+        """요청의 바이트 표현 (str() 변환 없이 캐시 키 생성용)"""
+        if not request:
+            return b""
+        if isinstance(request, (bytes, bytearray, memoryview)):
+            return request
+        if isinstance(request, Message):
+            return request.SerializeToString(deterministic=True)
+        try:
+            return pickle.dumps(request, protocol=5)
+        except Exception:
+            return str(request).encode("utf-8")
+
     def _make_key(self, method: str, request: Any) -> str:
         """캐시 키 생성"""
-        request_str = str(request) if request else ""
-        return f"{method}:{hash(request_str)}"
+        buf = self._request_bytes(request)
+        if xxhash is not None:
+            digest = xxhash.xxh3_64_hexdigest(buf)
+        else:
+            digest = hashlib.blake2b(buf, digest_size=8).hexdigest()
+        return f"{method}:{digest}"
 
     async def get(self, method: str, request: Any) -> Any | None:
         """캐시 조회"""
@@ -74,7 +105,7 @@ class FallbackCache:
                 del self._cache[key]
                 return None
 
-            logger.debug(f"Cache hit for {method}")
+            logger.debug("Cache hit for %s", method)
             return entry.value
 
     async def set(
@@ -96,17 +127,16 @@ class FallbackCache:
 
             self._cache[key] = CacheEntry(
                 value=response,
-                timestamp=time.time(),
-                ttl=ttl or self.config.cache_ttl,
+                expires_at=time.monotonic() + (ttl or self.config.cache_ttl),
             )
-            logger.debug(f"Cached response for {method}")
+            logger.debug("Cached response for %s", method)
 
     async def _evict_oldest(self):
-        """가장 오래된 캐시 제거"""
+        """가장 먼저 만료될 캐시 제거 (TTL 이 같으면 가장 오래된 엔트리)"""
         if not self._cache:
             return
 
-        oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k].timestamp)
+        oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k].expires_at)
         del self._cache[oldest_key]
 
     async def clear(self):
@@ -138,24 +168,58 @@ class RuleBasedFallback(FallbackHandler):
     def __init__(self):
         self._rules: dict[str, Callable[[Any], Any]] = {}
 
+        # 패턴 매칭용 Aho-Corasick 오토마톤 (pyahocorasick 설치 시, 지연 빌드)
+        self._automaton: Any = None
+        self._dirty = False
+
     def register_rule(self, method_pattern: str, handler: Callable[[Any], Any]):
         """폴백 규칙 등록"""
         self._rules[method_pattern] = handler
+        self._dirty = True
+
+    def _matching_rules(self, method_name: str) -> list[tuple[int, Callable[[Any], Any]]]:
+        """method_name 에 포함된 규칙을 등록 순서대로 반환 (한 번의 선형 스캔)
+
+        오토마톤 값은 (등록 순서, 핸들러) 라서 규칙 전체를 다시 순회하지 않음
+        """
+        if self._dirty:
+            automaton = ahocorasick.Automaton()
+            for index, (pattern, handler) in enumerate(self._rules.items()):
+                automaton.add_word(pattern, (index, handler))
+            automaton.make_automaton()
+            self._automaton = automaton
+            self._dirty = False
+
+        matched = {value[0]: value[1] for _, value in self._automaton.iter(method_name)}
+        return sorted(matched.items())
+
+    async def _apply(self, handler: Callable[[Any], Any], method: str, request: Any) -> Any:
+        """규칙 핸들러 실행 (코루틴 결과는 await)"""
+        result = handler(request)
+        if asyncio.iscoroutine(result):
+            result = await result
+        logger.info("Rule-based fallback triggered for %s", method)
+        return result
 
     async def handle(self, method: str, request: Any) -> Any | None:
-        """규칙 기반 폴백 응답"""
+        """규칙 기반 폴백 응답 (등록 순서상 처음 매칭되어 성공한 규칙 적용)"""
         method_name = method.split("/")[-1] if "/" in method else method
 
-        for pattern, handler in self._rules.items():
-            if pattern in method_name:
-                try:
-                    result = handler(request)
-                    if asyncio.iscoroutine(result):
-                        result = await result
-                    logger.info(f"Rule-based fallback triggered for {method}")
-                    return result
-                except Exception as e:
-                    logger.error(f"Fallback rule error for {method}: {e}")
+        if ahocorasick is None or not self._rules:
+            # 오토마톤 없이 등록 순서대로 검사하다 첫 성공에서 종료
+            for pattern, handler in self._rules.items():
+                if pattern in method_name:
+                    try:
+                        return await self._apply(handler, method, request)
+                    except Exception as e:
+                        logger.error("Fallback rule error for %s: %s", method, e)
+            return None
+
+        for _, handler in self._matching_rules(method_name):
+            try:
+                return await self._apply(handler, method, request)
+            except Exception as e:
+                logger.error("Fallback rule error for %s: %s", method, e)
 
         return None
 
@@ -4,19 +4,42 @@ asyncio 기반 고성능 서비스
 """
 
 import asyncio
+import itertools
 import logging
+import os
+import shlex
 import signal
 import sys
 import time
 from abc import ABC, abstractmethod
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from os.path import basename as _basename
 
 import grpc
 from grpc_health.v1 import health, health_pb2, health_pb2_grpc
 
+from .clock import now_iso
+
 # 생성된 proto 모듈
 from .grpc_generated import ai_agent_pb2, ai_agent_pb2_grpc
 
+# 응답에 gzip 압축을 적용할 최소 직렬화 응답 크기 (바이트)
+COMPRESSION_THRESHOLD = 4096
+
+# GenerateCode 응답 코드 템플릿
+_CODE_TEMPLATE = '''"""
+{desc}
+Generated by Claude gRPC Service
+"""
+
+def main():
+    # TODO: Implement {desc}
+    pass
+
+if __name__ == "__main__":
+    main()
+'''
+
 
 class GrpcBaseService(ABC):
     """gRPC 베이스 서비스 클래스"""
@@ -26,16 +49,17 @@ class GrpcBaseService(ABC):
         name: str,
         host: str = "0.0.0.0",
         port: int = 5001,
-        max_workers: int = 10,
+        max_workers: int | None = None,
         log_level: str = "INFO",
     ):
         self.name = name
         self.host = host
         self.port = port
-        self.max_workers = max_workers
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) * 2)
 
         # 상태
         self.server: grpc.aio.Server | None = None
+        self._executor: ThreadPoolExecutor | None = None
         self.start_time: float | None = None
         self._running = False
 
@@ -55,12 +79,27 @@ class GrpcBaseService(ABC):
             self.logger.addHandler(handler)
 
     async def start(self):
-        """gRPC 서버 시작"""
+        """gRPC 서버 시작
+
+        서비스 프로세스 전용 설정으로, 로그 레코드마다 스레드/프로세스 정보를
+        조회하지 않도록 logging 모듈 전역 플래그(logThreads, logProcesses,
+        logMultiprocessing)를 끔 - 같은 프로세스의 모든 로거에 적용됨
+        """
+        logging.logThreads = False
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
+
         self._running = True
         self.start_time = time.time()
 
+        # 블로킹 콜백용 스레드 풀 (CPU 수 기준으로 제한)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix=f"grpc-{self.name}"
+        )
+
         # 서버 생성
         self.server = grpc.aio.server(
+            migration_thread_pool=self._executor,
             options=[
                 ("grpc.max_send_message_length", 50 * 1024 * 1024),  # 50MB
                 ("grpc.max_receive_message_length", 50 * 1024 * 1024),
@@ -68,7 +107,6 @@ class GrpcBaseService(ABC):
                 ("grpc.keepalive_timeout_ms", 10000),
                 ("grpc.http2.min_ping_interval_without_data_ms", 5000),
             ],
-            compression=grpc.Compression.Gzip,
         )
 
         # 서비스 등록
@@ -90,9 +128,13 @@ class GrpcBaseService(ABC):
         self._print_banner()
 
         # 시그널 핸들러
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
+
+        def stop_cb():
+            loop.create_task(self.stop())
+
         for sig in (signal.SIGINT, signal.SIGTERM):
-            loop.add_signal_handler(sig, lambda: asyncio.create_task(self.stop()))
+            loop.add_signal_handler(sig, stop_cb)
 
         # 종료 대기
         await self.server.wait_for_termination()
@@ -109,6 +151,10 @@ class GrpcBaseService(ABC):
             # Graceful shutdown (5초 대기)
             await self.server.stop(5)
 
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
         self.logger.info("Server stopped")
 
     async def _set_health_status(self, status):
@@ -119,13 +165,12 @@ class GrpcBaseService(ABC):
 
     def _print_banner(self):
         """시작 배너 출력"""
-        int(time.time() - self.start_time) if self.start_time else 0
         banner = f"""
 ╔══════════════════════════════════════════════════════════════════╗
 ║  gRPC Service: {self.name.upper():<49} ║
 ║  Address: {self.host}:{self.port:<48} ║
 ║  Protocol: gRPC (HTTP/2 + Protobuf)                              ║
-║  Compression: gzip                                               ║
+║  Compression: per-call (gzip for large payloads)                 ║
 ╚══════════════════════════════════════════════════════════════════╝
 """
         self.logger.info(banner)
@@ -149,45 +194,8 @@ class ClaudeGrpcServicer(ai_agent_pb2_grpc.ClaudeServiceServicer):
         self.service = service
         self.logger = service.logger
 
-    async def HealthCheck(
-        self,
-        request: ai_agent_pb2.HealthCheckRequest,
-        context: grpc.aio.ServicerContext,
-    ) -> ai_agent_pb2.HealthCheckResponse:
-        """헬스 체크"""
-        return ai_agent_pb2.HealthCheckResponse(
-            status=ai_agent_pb2.HealthCheckResponse.ServingStatus.SERVING,
-            version="1.0.0",
-            uptime_seconds=self.service.get_uptime(),
-            active_connections=0,
-        )
-
-    async def Process(
-        self,
-        request: ai_agent_pb2.AgentRequest,
-        context: grpc.aio.ServicerContext,
-    ) -> ai_agent_pb2.AgentResponse:
-        """범용 처리"""
-        self.logger.debug(f"Process: {request.method}")
-
-        result = f"[Claude gRPC] Processed: {request.method}"
-
-        return ai_agent_pb2.AgentResponse(
-            request_id=request.request_id,
-            success=True,
-            result=result.encode("utf-8"),
-            timestamp=int(time.time() * 1000),
-        )
-
-    async def CreatePlan(
-        self,
-        request: ai_agent_pb2.PlanRequest,
-        context: grpc.aio.ServicerContext,
-    ) -> ai_agent_pb2.PlanResponse:
-        """계획 수립"""
-        self.logger.info(f"CreatePlan: {request.task_description}")
-
-        steps = [
+        # 요청과 무관한 고정 계획 단계 (protobuf 는 할당 시 복사하므로 공유해도 안전)
+        self._static_plan_steps = [
             ai_agent_pb2.PlanResponse.PlanStep(
                 order=1,
                 phase="Analysis",
@@ -224,13 +232,70 @@ class ClaudeGrpcServicer(ai_agent_pb2_grpc.ClaudeServiceServicer):
                 description="Claude가 검토 및 문서화",
             ),
         ]
+        self._static_agents = ("claude", "gemini", "codex")
+
+        # StreamPlan 진행/완료 메시지 템플릿 (stream_id/timestamp 만 요청별로 설정)
+        phases = ("Analysis", "Design", "Implementation", "Testing", "Review")
+        self._progress_messages = [
+            ai_agent_pb2.StreamMessage(
+                type="progress",
+                content=f"Phase {i + 1}: {phase}",
+                progress_percent=(i + 1) / len(phases) * 100,
+            )
+            for i, phase in enumerate(phases)
+        ]
+        self._progress_messages.append(
+            ai_agent_pb2.StreamMessage(
+                type="result",
+                content="Plan completed",
+                progress_percent=100,
+            )
+        )
+
+    async def HealthCheck(
+        self,
+        request: ai_agent_pb2.HealthCheckRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> ai_agent_pb2.HealthCheckResponse:
+        """헬스 체크"""
+        return ai_agent_pb2.HealthCheckResponse(
+            status=ai_agent_pb2.HealthCheckResponse.ServingStatus.SERVING,
+            version="1.0.0",
+            uptime_seconds=self.service.get_uptime(),
+            active_connections=0,
+        )
+
+    async def Process(
+        self,
+        request: ai_agent_pb2.AgentRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> ai_agent_pb2.AgentResponse:
+        """범용 처리"""
+        self.logger.debug("Process: %s", request.method)
+
+        result = f"[Claude gRPC] Processed: {request.method}"
+
+        return ai_agent_pb2.AgentResponse(
+            request_id=request.request_id,
+            success=True,
+            result=result.encode("utf-8"),
+            timestamp=int(time.time() * 1000),
+        )
+
+    async def CreatePlan(
+        self,
+        request: ai_agent_pb2.PlanRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> ai_agent_pb2.PlanResponse:
+        """계획 수립"""
+        self.logger.info("CreatePlan: %s", request.task_description)
 
         return ai_agent_pb2.PlanResponse(
             task=request.task_description,
-            steps=steps,
-            total_steps=len(steps),
-            estimated_agents=["claude", "gemini", "codex"],
-            created_at=datetime.now().isoformat(),
+            steps=self._static_plan_steps,
+            total_steps=len(self._static_plan_steps),
+            estimated_agents=self._static_agents,
+            created_at=now_iso(),
         )
 
     async def GenerateCode(
@@ -239,26 +304,15 @@ class ClaudeGrpcServicer(ai_agent_pb2_grpc.ClaudeServiceServicer):
         context: grpc.aio.ServicerContext,
     ) -> ai_agent_pb2.GenerateCodeResponse:
         """코드 생성"""
-        self.logger.info(f"GenerateCode: {request.language}")
-
-        code = f'''"""
-{request.description}
-Generated by Claude gRPC Service
-"""
-
-def main():
-    # TODO: Implement {request.description}
-    pass
+        self.logger.info("GenerateCode: %s", request.language)
 
-if __name__ == "__main__":
-    main()
-'''
+        code = _CODE_TEMPLATE.format(desc=request.description)
 
         return ai_agent_pb2.GenerateCodeResponse(
             language=request.language,
             code=code,
             description=request.description,
-            generated_at=datetime.now().isoformat(),
+            generated_at=now_iso(),
         )
 
     async def StreamPlan(
@@ -267,27 +321,18 @@ if __name__ == "__main__":
         context: grpc.aio.ServicerContext,
     ):
         """스트리밍 계획 수립"""
-        self.logger.info(f"StreamPlan: {request.task_description}")
-
-        phases = ["Analysis", "Design", "Implementation", "Testing", "Review"]
+        self.logger.info("StreamPlan: %s", request.task_description)
 
-        for i, phase in enumerate(phases):
-            yield ai_agent_pb2.StreamMessage(
-                stream_id=f"plan-{request.task_description[:10]}",
-                type="progress",
-                content=f"Phase {i + 1}: {phase}",
-                progress_percent=(i + 1) / len(phases) * 100,
-                timestamp=int(time.time() * 1000),
-            )
-            await asyncio.sleep(0.5)  # 시뮬레이션
+        stream_id = f"plan-{request.task_description[:10]}"
+        ts_ms = int(time.time() * 1000)
 
-        yield ai_agent_pb2.StreamMessage(
-            stream_id=f"plan-{request.task_description[:10]}",
-            type="result",
-            content="Plan completed",
-            progress_percent=100,
-            timestamp=int(time.time() * 1000),
-        )
+        # 템플릿 복사 후 요청별 필드만 설정 (인위적 지연 없이 즉시 전송)
+        for template in self._progress_messages:
+            message = ai_agent_pb2.StreamMessage()
+            message.CopyFrom(template)
+            message.stream_id = stream_id
+            message.timestamp = ts_ms
+            yield message
 
 
 class ClaudeGrpcService(GrpcBaseService):
@@ -309,6 +354,29 @@ class GeminiGrpcServicer(ai_agent_pb2_grpc.GeminiServiceServicer):
         self.service = service
         self.logger = service.logger
 
+        # 요청과 무관한 고정 결과 (protobuf 는 할당 시 복사하므로 공유해도 안전)
+        self._static_findings = [
+            ai_agent_pb2.AnalyzeResponse.Finding(
+                category="structure",
+                severity="info",
+                description="Code structure analysis completed",
+            ),
+            ai_agent_pb2.AnalyzeResponse.Finding(
+                category="patterns",
+                severity="info",
+                description="Design patterns identified",
+            ),
+        ]
+        self._static_issues = [
+            ai_agent_pb2.ReviewCodeResponse.Issue(
+                type="style",
+                severity="low",
+                line=1,
+                message="Consider adding docstring",
+                suggestion="Add module docstring",
+            ),
+        ]
+
     async def HealthCheck(
         self,
         request: ai_agent_pb2.HealthCheckRequest,
@@ -326,55 +394,40 @@ class GeminiGrpcServicer(ai_agent_pb2_grpc.GeminiServiceServicer):
         context: grpc.aio.ServicerContext,
     ) -> ai_agent_pb2.AnalyzeResponse:
         """분석"""
-        self.logger.info(f"Analyze: {request.analysis_type}")
-
-        findings = [
-            ai_agent_pb2.AnalyzeResponse.Finding(
-                category="structure",
-                severity="info",
-                description="Code structure analysis completed",
-            ),
-            ai_agent_pb2.AnalyzeResponse.Finding(
-                category="patterns",
-                severity="info",
-                description="Design patterns identified",
-            ),
-        ]
+        self.logger.info("Analyze: %s", request.analysis_type)
 
-        return ai_agent_pb2.AnalyzeResponse(
+        clen = len(request.content)
+        response = ai_agent_pb2.AnalyzeResponse(
             analysis_type=request.analysis_type,
-            content_length=len(request.content),
-            token_estimate=len(request.content) // 4,
-            findings=findings,
-            summary=f"Analysis completed for {len(request.content)} chars",
-            analyzed_at=datetime.now().isoformat(),
+            content_length=clen,
+            token_estimate=clen >> 2,
+            findings=self._static_findings,
+            summary=f"Analysis completed for {clen} chars",
+            analyzed_at=now_iso(),
         )
 
+        # 응답에는 콘텐츠가 들어가지 않으므로 요청 크기가 아닌 직렬화된 응답 크기로 판단
+        # (작은 응답은 압축 비용이 이득보다 큼)
+        if response.ByteSize() > COMPRESSION_THRESHOLD:
+            context.set_compression(grpc.Compression.Gzip)
+
+        return response
+
     async def ReviewCode(
         self,
         request: ai_agent_pb2.ReviewCodeRequest,
         context: grpc.aio.ServicerContext,
     ) -> ai_agent_pb2.ReviewCodeResponse:
         """코드 리뷰"""
-        self.logger.info(f"ReviewCode: {request.language}")
-
-        issues = [
-            ai_agent_pb2.ReviewCodeResponse.Issue(
-                type="style",
-                severity="low",
-                line=1,
-                message="Consider adding docstring",
-                suggestion="Add module docstring",
-            ),
-        ]
+        self.logger.info("ReviewCode: %s", request.language)
 
         return ai_agent_pb2.ReviewCodeResponse(
             language=request.language,
             review_type=request.review_type,
             code_length=len(request.code),
-            issues=issues,
+            issues=self._static_issues,
             overall_score=95.0,
-            reviewed_at=datetime.now().isoformat(),
+            reviewed_at=now_iso(),
         )
 
 
@@ -392,29 +445,34 @@ class GeminiGrpcService(GrpcBaseService):
 class CodexGrpcServicer(ai_agent_pb2_grpc.CodexServiceServicer):
     """Codex gRPC 서비스 구현"""
 
-    ALLOWED_COMMANDS = [
-        "echo",
-        "ls",
-        "pwd",
-        "date",
-        "cat",
-        "head",
-        "tail",
-        "wc",
-        "grep",
-        "find",
-        "python",
-        "pip",
-        "npm",
-        "node",
-        "git",
-        "make",
-    ]
+    ALLOWED_COMMANDS = frozenset(
+        {
+            "echo",
+            "ls",
+            "pwd",
+            "date",
+            "cat",
+            "head",
+            "tail",
+            "wc",
+            "grep",
+            "find",
+            "python",
+            "pip",
+            "npm",
+            "node",
+            "git",
+            "make",
+        }
+    )
 
     def __init__(self, service: "CodexGrpcService"):
         self.service = service
         self.logger = service.logger
 
+        # StreamExecute stream_id 생성용 카운터
+        self._stream_counter = itertools.count()
+
     async def HealthCheck(
         self,
         request: ai_agent_pb2.HealthCheckRequest,
@@ -432,10 +490,11 @@ class CodexGrpcServicer(ai_agent_pb2_grpc.CodexServiceServicer):
         context: grpc.aio.ServicerContext,
     ) -> ai_agent_pb2.ExecuteResponse:
         """명령 실행"""
-        self.logger.info(f"Execute: {request.command}")
+        self.logger.info("Execute: %s", request.command)
 
-        # 명령어 검증
-        if not self._validate_command(request.command):
+        # 명령어 검증 (검증과 실행이 같은 토큰화 결과를 사용)
+        argv = self._parse_command(request.command)
+        if argv is None:
             return ai_agent_pb2.ExecuteResponse(
                 success=False,
                 command=request.command,
@@ -443,19 +502,26 @@ class CodexGrpcServicer(ai_agent_pb2_grpc.CodexServiceServicer):
                 stderr="Command not allowed",
             )
 
-        # 명령 실행
+        # 명령 실행 (셸을 거치지 않고 직접 exec)
         start_time = time.perf_counter()
 
         try:
-            import os
-
-            process = await asyncio.create_subprocess_shell(
-                request.command,
+            process = await asyncio.create_subprocess_exec(
+                *argv,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
                 cwd=request.working_dir or os.getcwd(),
             )
+        except OSError as e:
+            return ai_agent_pb2.ExecuteResponse(
+                success=False,
+                command=request.command,
+                exit_code=-1,
+                stderr=str(e),
+                executed_at=now_iso(),
+            )
 
+        try:
             stdout, stderr = await asyncio.wait_for(
                 process.communicate(),
                 timeout=request.timeout_seconds or 30,
@@ -469,59 +535,107 @@ class CodexGrpcServicer(ai_agent_pb2_grpc.CodexServiceServicer):
                 exit_code=process.returncode,
                 stdout=stdout.decode("utf-8", errors="replace"),
                 stderr=stderr.decode("utf-8", errors="replace"),
-                duration_seconds=round(duration, 3),
-                executed_at=datetime.now().isoformat(),
+                duration_seconds=duration,
+                executed_at=now_iso(),
             )
 
         except TimeoutError:
+            process.kill()
+            await process.wait()
             return ai_agent_pb2.ExecuteResponse(
                 success=False,
                 command=request.command,
                 exit_code=-1,
                 stderr="Command timed out",
-                executed_at=datetime.now().isoformat(),
+                executed_at=now_iso(),
             )
 
-    def _validate_command(self, command: str) -> bool:
-        """명령어 검증"""
+    def _parse_command(self, command: str) -> list[str] | None:
+        """명령어 토큰화 및 검증 (허용되지 않으면 None)"""
         if not command:
-            return False
+            return None
 
-        cmd_parts = command.strip().split()
-        if not cmd_parts:
-            return False
+        try:
+            argv = shlex.split(command)
+        except ValueError:
+            return None
+        if not argv:
+            return None
 
-        import os
+        if _basename(argv[0]) not in self.ALLOWED_COMMANDS:
+            return None
 
-        base_cmd = os.path.basename(cmd_parts[0])
+        return argv
 
-        return base_cmd in self.ALLOWED_COMMANDS
+    def _validate_command(self, command: str) -> bool:
+        """명령어 검증"""
+        return self._parse_command(command) is not None
 
     async def StreamExecute(
         self,
         request: ai_agent_pb2.ExecuteRequest,
         context: grpc.aio.ServicerContext,
     ):
-        """스트리밍 실행"""
-        self.logger.info(f"StreamExecute: {request.command}")
+        """스트리밍 실행 (출력을 한 줄씩 전송)"""
+        self.logger.info("StreamExecute: %s", request.command)
 
-        yield ai_agent_pb2.StreamMessage(
-            stream_id=f"exec-{hash(request.command)}",
-            type="log",
-            content=f"Starting: {request.command}",
-            timestamp=int(time.time() * 1000),
-        )
+        stream_id = f"exec-{next(self._stream_counter)}"
 
-        # 실제 실행
-        result = await self.Execute(request, context)
+        def message(msg_type: str, content: str, progress: float = 0.0):
+            return ai_agent_pb2.StreamMessage(
+                stream_id=stream_id,
+                type=msg_type,
+                content=content,
+                progress_percent=progress,
+                timestamp=int(time.time() * 1000),
+            )
 
-        yield ai_agent_pb2.StreamMessage(
-            stream_id=f"exec-{hash(request.command)}",
-            type="result",
-            content=result.stdout or result.stderr,
-            progress_percent=100,
-            timestamp=int(time.time() * 1000),
-        )
+        yield message("log", f"Starting: {request.command}")
+
+        argv = self._parse_command(request.command)
+        if argv is None:
+            yield message("error", "Command not allowed", 100)
+            return
+
+        try:
+            # stderr 는 stdout 에 합쳐서 출력 순서를 유지
+            process = await asyncio.create_subprocess_exec(
+                *argv,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+                cwd=request.working_dir or os.getcwd(),
+            )
+        except OSError as e:
+            yield message("error", str(e), 100)
+            return
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + (request.timeout_seconds or 30)
+        try:
+            while not context.cancelled():
+                try:
+                    line = await asyncio.wait_for(process.stdout.readline(), deadline - loop.time())
+                except ValueError:
+                    # 한 줄이 스트림 버퍼 한도를 넘음 - 해당 줄은 버리고 계속 읽음
+                    yield message("log", "[line too long, skipped]")
+                    continue
+                if not line:
+                    break
+                yield message("log", line.decode("utf-8", errors="replace").rstrip("\n"))
+            else:
+                # 클라이언트 취소 - finally 에서 프로세스 종료
+                return
+
+            exit_code = await asyncio.wait_for(process.wait(), deadline - loop.time())
+        except TimeoutError:
+            yield message("error", "Command timed out", 100)
+            return
+        finally:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+
+        yield message("result", f"Exit code: {exit_code}", 100)
 
 
 class CodexGrpcService(GrpcBaseService):
@@ -552,8 +666,6 @@ async def run_codex_grpc():
 
 
 if __name__ == "__main__":
-    import sys
-
     service_name = sys.argv[1] if len(sys.argv) > 1 else "claude"
 
     services = {
@@ -1,33 +1,39 @@
 """
 gRPC Interceptors for Resilience
 Phase 3: Circuit Breaker, Retry, Adaptive Timeout
+
+서브모듈은 처음 참조될 때 로드 (PEP 562)
 """
 
-from .adaptive_timeout import (
-    AdaptiveTimeoutInterceptor,
-    TimeoutManager,
-)
-from .circuit_breaker import (
-    CircuitBreaker,
-    CircuitBreakerInterceptor,
-    CircuitBreakerOpenError,
-    CircuitBreakerState,
-)
-from .retry import (
-    RetryInterceptor,
-    RetryPolicy,
-)
-
-__all__ = [
+import importlib
+
+# 공개 이름 -> 정의된 서브모듈
+_ATTR_MAP = {
     # Circuit Breaker
-    "CircuitBreaker",
-    "CircuitBreakerInterceptor",
-    "CircuitBreakerState",
-    "CircuitBreakerOpenError",
+    "CircuitBreaker": "circuit_breaker",
+    "CircuitBreakerInterceptor": "circuit_breaker",
+    "CircuitBreakerState": "circuit_breaker",
+    "CircuitBreakerOpenError": "circuit_breaker",
     # Retry
-    "RetryInterceptor",
-    "RetryPolicy",
+    "RetryInterceptor": "retry",
+    "RetryPolicy": "retry",
     # Adaptive Timeout
-    "AdaptiveTimeoutInterceptor",
-    "TimeoutManager",
-]
+    "AdaptiveTimeoutInterceptor": "adaptive_timeout",
+    "TimeoutManager": "adaptive_timeout",
+}
+
+__all__ = list(_ATTR_MAP)
+
+
+def __getattr__(name: str):
+    try:
+        module_name = _ATTR_MAP[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # 이후 조회는 __getattr__를 거치지 않음
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -8,19 +8,38 @@ Phase 3: Resilience
 - 응답 시간 기반 자동 조정
 """
 
-import asyncio
 import logging
 import time
-from collections import defaultdict
-from collections.abc import Callable
+from bisect import bisect_left, insort
+from collections import defaultdict, deque
+from collections.abc import Callable, Collection, Sequence
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
 import grpc
 
+try:
+    from sortedcontainers import SortedList
+except ImportError:  # pragma: no cover - 선택 의존성
+    SortedList = None
+
 logger = logging.getLogger(__name__)
 
 
+class _BisectList(list):
+    """SortedList 대체 (sortedcontainers 미설치 시) - bisect로 정렬 상태 유지"""
+
+    def add(self, value: float) -> None:
+        insort(self, value)
+
+    def remove(self, value: float) -> None:
+        del self[bisect_left(self, value)]
+
+
+_SortedList = SortedList if SortedList is not None else _BisectList
+
+
 @dataclass
 class TimeoutConfig:
     """타임아웃 설정"""
@@ -46,6 +65,10 @@ class TimeoutConfig:
     percentile: float = 95.0
     history_size: int = 100
     adjustment_factor: float = 1.5
+    # N 개 응답마다 1개만 기록 (1 이면 전부 기록)
+    sample_rate: int = 1
+    # 계산한 타임아웃을 새 샘플이 이만큼 쌓일 때까지 재사용
+    recompute_interval: int = 16
 
 
 class TimeoutManager:
@@ -53,24 +76,59 @@ class TimeoutManager:
 
     def __init__(self, config: TimeoutConfig | None = None):
         self.config = config or TimeoutConfig()
-        self._response_times: dict[str, list[float]] = defaultdict(list)
-        self._lock = asyncio.Lock()
-
-    async def record_response_time(self, method: str, duration: float):
-        """응답 시간 기록"""
-        async with self._lock:
-            history = self._response_times[method]
-            history.append(duration)
-
-            if len(history) > self.config.history_size:
-                history.pop(0)
-
-    def _get_percentile(self, data: list[float], percentile: float) -> float:
+        # 메서드별 최근 응답 시간 (maxlen 초과 시 가장 오래된 값이 O(1)로 밀려남)
+        history_size = self.config.history_size
+        self._response_times: dict[str, deque[float]] = defaultdict(
+            lambda: deque(maxlen=history_size)
+        )
+        # 같은 값들을 정렬 상태로 유지 (백분위수 조회 시 매번 정렬하지 않음)
+        self._sorted_times: dict[str, Any] = defaultdict(_SortedList)
+        # 메서드 경로 → 메서드 이름 캐시 (stub 마다 같은 경로가 반복됨)
+        # 기본 타임아웃은 config 수정이 바로 반영되도록 매번 조회
+        self._resolve = lru_cache(maxsize=256)(self._extract_method_name)
+        # 샘플링용 메서드별 기록 요청 횟수
+        self._record_counts: dict[str, int] = defaultdict(int)
+        # 윈도우 합계 (평균을 매번 sum() 으로 다시 계산하지 않음)
+        self._running_sums: dict[str, float] = defaultdict(float)
+        # 메서드별 누적 기록 수와 (그 시점 기록 수, 계산된 타임아웃) 캐시
+        self._history_versions: dict[str, int] = defaultdict(int)
+        self._timeout_cache: dict[str, tuple[int, float]] = {}
+
+    def record_response_time(self, method: str, duration: float):
+        """응답 시간 기록
+
+        await 가 없는 동기 구간이라 단일 이벤트 루프에서는 락 없이도 원자적
+        """
+        sample_rate = self.config.sample_rate
+        if sample_rate > 1:
+            # 메서드별로 세어서 여러 메서드가 번갈아 호출돼도 한쪽만 샘플링되지 않게 함
+            count = self._record_counts[method]
+            self._record_counts[method] = count + 1
+            if count % sample_rate:
+                return
+
+        history = self._response_times[method]
+        sorted_times = self._sorted_times[method]
+        running_sum = self._running_sums[method] + duration
+        if len(history) == history.maxlen:
+            evicted = history[0]
+            sorted_times.remove(evicted)
+            running_sum -= evicted
+        history.append(duration)
+        sorted_times.add(duration)
+        self._running_sums[method] = running_sum
+        self._history_versions[method] += 1
+
+    def _get_percentile(self, data: Collection[float], percentile: float) -> float:
         """백분위수 계산"""
         if not data:
             return self.config.default_timeout
 
-        sorted_data = sorted(data)
+        return self._percentile_of_sorted(sorted(data), percentile)
+
+    @staticmethod
+    def _percentile_of_sorted(sorted_data: Sequence[float], percentile: float) -> float:
+        """정렬된 데이터에서 백분위수 조회"""
         index = int(len(sorted_data) * percentile / 100)
         index = min(index, len(sorted_data) - 1)
         return sorted_data[index]
@@ -79,52 +137,66 @@ class TimeoutManager:
         """gRPC 메서드 경로에서 메서드 이름 추출"""
         if isinstance(full_method, bytes):
             full_method = full_method.decode("utf-8")
-        if "/" in full_method:
-            return full_method.split("/")[-1]
-        return full_method
+        # split() 은 매번 리스트를 만들므로 마지막 '/' 위치로 바로 자름
+        return full_method[full_method.rfind("/") + 1 :]
 
     async def get_timeout(self, method: str) -> float:
-        """메서드별 적응형 타임아웃 반환"""
-        method_name = self._extract_method_name(method)
+        """메서드별 적응형 타임아웃 반환
 
-        base_timeout = self.config.method_timeouts.get(method_name, self.config.default_timeout)
+        히스토리는 record_response_time 에 넘긴 것과 같은 키(method)로 조회하고,
+        계산 결과는 recompute_interval 개의 새 샘플이 쌓일 때까지 재사용
+        """
+        method_name = self._resolve(method)
+        config = self.config
+        base_timeout = config.method_timeouts.get(method_name, config.default_timeout)
 
         if not self.config.adaptive_enabled:
             return base_timeout
 
-        async with self._lock:
-            history = self._response_times.get(method_name, [])
+        version = self._history_versions.get(method, 0)
+        cached = self._timeout_cache.get(method)
+        if cached is not None and version - cached[0] < self.config.recompute_interval:
+            return cached[1]
 
-            if len(history) < 10:
-                return base_timeout
+        sorted_times = self._sorted_times.get(method, ())
 
-            p95_time = self._get_percentile(history, self.config.percentile)
-            adaptive_timeout = p95_time * self.config.adjustment_factor
+        if len(sorted_times) < 10:
+            return base_timeout
 
-            final_timeout = max(
-                self.config.min_timeout,
-                min(adaptive_timeout, self.config.max_timeout, base_timeout * 2),
-            )
+        p95_time = self._percentile_of_sorted(sorted_times, self.config.percentile)
+        adaptive_timeout = p95_time * self.config.adjustment_factor
 
-            logger.debug(
-                f"Adaptive timeout for {method_name}: "
-                f"base={base_timeout:.1f}s, p95={p95_time:.1f}s, "
-                f"final={final_timeout:.1f}s"
-            )
+        final_timeout = max(
+            self.config.min_timeout,
+            min(adaptive_timeout, self.config.max_timeout, base_timeout * 2),
+        )
 
-            return final_timeout
+        logger.debug(
+            "Adaptive timeout for %s: base=%.1fs, p95=%.1fs, final=%.1fs",
+            method_name,
+            base_timeout,
+            p95_time,
+            final_timeout,
+        )
+
+        self._timeout_cache[method] = (version, final_timeout)
+        return final_timeout
 
     def get_metrics(self) -> dict[str, Any]:
-        """메트릭 반환"""
+        """메트릭 반환
+
+        합계는 기록 시 누적, 최소/최대/p95 는 정렬 리스트에서 바로 읽으므로 순회가 없음
+        """
         metrics = {}
         for method, times in self._response_times.items():
             if times:
+                sorted_times = self._sorted_times[method]
                 metrics[method] = {
                     "count": len(times),
-                    "avg": sum(times) / len(times),
-                    "min": min(times),
-                    "max": max(times),
-                    "p95": self._get_percentile(times, 95),
+                    "avg": self._running_sums[method] / len(times),
+                    "min": sorted_times[0],
+                    "max": sorted_times[-1],
+                    "p95": self._percentile_of_sorted(sorted_times, 95),
                 }
         return metrics
 
@@ -155,13 +227,11 @@ class AdaptiveTimeoutInterceptor(grpc.aio.UnaryUnaryClientInterceptor):
 
         timeout = await self.timeout_manager.get_timeout(method)
 
-        new_details = grpc.aio.ClientCallDetails(
-            method=client_call_details.method,
-            timeout=timeout,
-            metadata=client_call_details.metadata,
-            credentials=client_call_details.credentials,
-            wait_for_ready=client_call_details.wait_for_ready,
-        )
+        # ClientCallDetails 는 namedtuple - timeout 이 달라질 때만 복사본 생성
+        if timeout == client_call_details.timeout:
+            new_details = client_call_details
+        else:
+            new_details = client_call_details._replace(timeout=timeout)
 
         start_time = time.perf_counter()
 
@@ -169,13 +239,13 @@ class AdaptiveTimeoutInterceptor(grpc.aio.UnaryUnaryClientInterceptor):
             response = await continuation(new_details, request)
 
             duration = time.perf_counter() - start_time
-            await self.timeout_manager.record_response_time(method, duration)
+            self.timeout_manager.record_response_time(method, duration)
 
             return response
 
         except grpc.aio.AioRpcError:
             duration = time.perf_counter() - start_time
-            await self.timeout_manager.record_response_time(method, duration)
+            self.timeout_manager.record_response_time(method, duration)
             raise
 
 
@@ -201,12 +271,10 @@ class AdaptiveTimeoutStreamInterceptor(grpc.aio.UnaryStreamClientInterceptor):
 
         timeout = await self.timeout_manager.get_timeout(method)
 
-        new_details = grpc.aio.ClientCallDetails(
-            method=client_call_details.method,
-            timeout=timeout,
-            metadata=client_call_details.metadata,
-            credentials=client_call_details.credentials,
-            wait_for_ready=client_call_details.wait_for_ready,
-        )
+        # ClientCallDetails 는 namedtuple - timeout 이 달라질 때만 복사본 생성
+        if timeout == client_call_details.timeout:
+            new_details = client_call_details
+        else:
+            new_details = client_call_details._replace(timeout=timeout)
 
         return await continuation(new_details, request)
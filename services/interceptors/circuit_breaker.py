@@ -11,6 +11,7 @@ Circuit Breaker 패턴:
 import asyncio
 import logging
 import time
+from collections import deque
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import Enum
@@ -30,6 +31,18 @@ class CircuitBreakerState(Enum):
     HALF_OPEN = "half_open"  # 복구 테스트 중
 
 
+# 보관할 최근 상태 변경 이력 개수
+STATE_HISTORY_SIZE = 100
+
+# 내부 상태 코드 (핫 패스에서 Enum 비교 대신 정수 비교)
+_CLOSED, _OPEN, _HALF_OPEN = 0, 1, 2
+_STATE_CODES = {
+    CircuitBreakerState.CLOSED: _CLOSED,
+    CircuitBreakerState.OPEN: _OPEN,
+    CircuitBreakerState.HALF_OPEN: _HALF_OPEN,
+}
+
+
 class CircuitBreakerOpenError(Exception):
     """Circuit Breaker가 OPEN 상태일 때 발생"""
 
@@ -51,16 +64,22 @@ class CircuitBreakerConfig:
     half_open_max_calls: int = 3  # HALF_OPEN에서 허용할 최대 동시 요청
 
     # 실패로 카운트할 gRPC 상태 코드 (시스템 에러만)
-    failure_status_codes: set[StatusCode] = field(
-        default_factory=lambda: {
-            StatusCode.UNAVAILABLE,
-            StatusCode.DEADLINE_EXCEEDED,
-            StatusCode.RESOURCE_EXHAUSTED,
-            StatusCode.INTERNAL,
-            StatusCode.UNKNOWN,
-        }
+    failure_status_codes: frozenset[StatusCode] = field(
+        default_factory=lambda: frozenset(
+            {
+                StatusCode.UNAVAILABLE,
+                StatusCode.DEADLINE_EXCEEDED,
+                StatusCode.RESOURCE_EXHAUSTED,
+                StatusCode.INTERNAL,
+                StatusCode.UNKNOWN,
+            }
+        )
     )
 
+    def __post_init__(self):
+        # 비트마스크는 StatusCode.value(파이썬 프로퍼티) 조회 때문에 오히려 느려서 frozenset 유지
+        self.failure_status_codes = frozenset(self.failure_status_codes)
+
 
 class CircuitBreaker:
     """
@@ -77,71 +96,103 @@ class CircuitBreaker:
         self,
         name: str,
         config: CircuitBreakerConfig | None = None,
+        *,
+        time_fn: Callable[[], float] = time.monotonic,
     ):
         self.name = name
         self.config = config or CircuitBreakerConfig()
+        # 경과 시간 측정용 단조 시계 (테스트에서는 가짜 시계 주입)
+        self._now = time_fn
 
         # 상태
         self._state = CircuitBreakerState.CLOSED
+        self._state_int = _CLOSED  # _state 와 항상 함께 갱신
         self._failure_count = 0
         self._success_count = 0
-        self._last_failure_time: float | None = None
+        # 마지막 실패 시각 (_now 기준 - 시스템 시계 조정에 영향받지 않음)
+        self._last_failure_at: float | None = None
         self._half_open_calls = 0
 
-        # 동기화
-        self._lock = asyncio.Lock()
+        # 상태 전이만 보호 (카운터 갱신과 CLOSED/OPEN 판정은 락 없이 처리)
+        self._state_lock = asyncio.Lock()
 
-        # 메트릭
-        self._total_calls = 0
+        # 메트릭 (total_calls 는 성공+실패로 계산하므로 따로 세지 않음)
         self._total_failures = 0
         self._total_successes = 0
-        self._state_changes: list = []
+        self._state_change_count = 0
+        # 최근 상태 변경 이력만 보관 (상태가 계속 바뀌어도 메모리가 늘지 않음)
+        self._state_changes: deque[dict[str, Any]] = deque(maxlen=STATE_HISTORY_SIZE)
 
         logger.info(f"CircuitBreaker '{name}' initialized: {self.config}")
 
     @property
     def state(self) -> CircuitBreakerState:
         """현재 상태 반환 (자동 상태 전이 체크)"""
-        if self._state == CircuitBreakerState.OPEN and self._should_attempt_reset():
+        if self._state_int == _OPEN and self._should_attempt_reset():
             return CircuitBreakerState.HALF_OPEN
         return self._state
 
+    def _current_state_int(self) -> int:
+        """state 프로퍼티의 정수 버전"""
+        if self._state_int == _OPEN and self._should_attempt_reset():
+            return _HALF_OPEN
+        return self._state_int
+
     def _should_attempt_reset(self) -> bool:
         """OPEN → HALF_OPEN 전환 조건 확인"""
-        if self._last_failure_time is None:
+        if self._last_failure_at is None:
             return False
-        elapsed = time.time() - self._last_failure_time
+        elapsed = self._now() - self._last_failure_at
         return elapsed >= self.config.reset_timeout
 
+    def reset_remaining(self) -> float:
+        """HALF_OPEN 전환까지 남은 시간 (초)"""
+        if self._last_failure_at is None:
+            return 0.0
+        elapsed = self._now() - self._last_failure_at
+        return max(0.0, self.config.reset_timeout - elapsed)
+
     async def can_execute(self) -> bool:
         """요청 실행 가능 여부 확인"""
-        async with self._lock:
-            current_state = self.state
+        # CLOSED 는 락 없이 바로 통과 (대부분의 요청)
+        state = self._state_int
+        if state == _CLOSED:
+            return True
+        # 장애 중 reset_timeout 전까지의 거부도 락 없이 처리
+        if state == _OPEN and not self._should_attempt_reset():
+            return False
+
+        async with self._state_lock:
+            current_state = self._current_state_int()
 
-            if current_state == CircuitBreakerState.CLOSED:
+            if current_state == _CLOSED:
                 return True
 
-            if current_state == CircuitBreakerState.OPEN:
+            if current_state == _OPEN:
                 return False
 
             # HALF_OPEN: 제한된 요청만 허용
-            if current_state == CircuitBreakerState.HALF_OPEN:
-                if self._half_open_calls < self.config.half_open_max_calls:
-                    self._half_open_calls += 1
-                    return True
-                return False
-
+            if self._half_open_calls < self.config.half_open_max_calls:
+                self._half_open_calls += 1
+                return True
             return False
 
     async def record_success(self):
         """성공 기록"""
-        async with self._lock:
-            self._total_calls += 1
-            self._total_successes += 1
+        # 카운터 갱신은 await 없는 정수 연산이라 락이 필요 없음
+        self._total_successes += 1
 
-            current_state = self.state
+        if self._state_int == _CLOSED:
+            # 성공 시 실패 카운트 감소 (점진적 복구)
+            if self._failure_count > 0:
+                self._failure_count -= 1
+            return
+
+        # 상태 전이가 일어날 수 있는 경우만 락 사용
+        async with self._state_lock:
+            current_state = self._current_state_int()
 
-            if current_state == CircuitBreakerState.HALF_OPEN:
+            if current_state == _HALF_OPEN:
                 self._success_count += 1
                 logger.debug(
                     f"CircuitBreaker '{self.name}' HALF_OPEN success: "
@@ -151,10 +202,8 @@ class CircuitBreaker:
                 if self._success_count >= self.config.success_threshold:
                     self._transition_to(CircuitBreakerState.CLOSED)
 
-            elif current_state == CircuitBreakerState.CLOSED:
-                # 성공 시 실패 카운트 감소 (점진적 복구)
-                if self._failure_count > 0:
-                    self._failure_count -= 1
+            elif current_state == _CLOSED and self._failure_count > 0:
+                self._failure_count -= 1
 
     async def record_failure(self, status_code: StatusCode | None = None):
         """실패 기록"""
@@ -165,19 +214,27 @@ class CircuitBreaker:
             )
             return
 
-        async with self._lock:
-            self._total_calls += 1
-            self._total_failures += 1
-            self._last_failure_time = time.time()
+        self._total_failures += 1
+        self._last_failure_at = self._now()
 
-            current_state = self.state
+        # CLOSED 에서 임계치에 닿지 않는 실패는 락 없이 카운트
+        if self._state_int == _CLOSED and self._failure_count + 1 < self.config.failure_threshold:
+            self._failure_count += 1
+            logger.debug(
+                f"CircuitBreaker '{self.name}' failure: "
+                f"{self._failure_count}/{self.config.failure_threshold}"
+            )
+            return
+
+        async with self._state_lock:
+            current_state = self._current_state_int()
 
-            if current_state == CircuitBreakerState.HALF_OPEN:
+            if current_state == _HALF_OPEN:
                 # HALF_OPEN에서 실패 → 즉시 OPEN
                 logger.warning(f"CircuitBreaker '{self.name}' failure in HALF_OPEN, reopening")
                 self._transition_to(CircuitBreakerState.OPEN)
 
-            elif current_state == CircuitBreakerState.CLOSED:
+            elif current_state == _CLOSED:
                 self._failure_count += 1
                 logger.debug(
                     f"CircuitBreaker '{self.name}' failure: "
@@ -191,6 +248,7 @@ class CircuitBreaker:
         """상태 전이"""
         old_state = self._state
         self._state = new_state
+        self._state_int = _STATE_CODES[new_state]
 
         # 카운터 리셋
         if new_state == CircuitBreakerState.CLOSED:
@@ -202,6 +260,7 @@ class CircuitBreaker:
             self._half_open_calls = 0
 
         # 상태 변경 기록
+        self._state_change_count += 1
         self._state_changes.append(
             {
                 "from": old_state.value,
@@ -213,22 +272,26 @@ class CircuitBreaker:
         logger.warning(f"CircuitBreaker '{self.name}' state: {old_state.value} → {new_state.value}")
 
     def get_metrics(self) -> dict[str, Any]:
-        """메트릭 반환"""
+        """메트릭 반환 (락 없이 카운터를 그대로 읽는 스냅샷)"""
         return {
             "name": self.name,
             "state": self.state.value,
-            "total_calls": self._total_calls,
+            "total_calls": self._total_successes + self._total_failures,
             "total_successes": self._total_successes,
             "total_failures": self._total_failures,
             "failure_count": self._failure_count,
             "success_count": self._success_count,
-            "state_changes": len(self._state_changes),
-            "last_failure_time": self._last_failure_time,
+            "state_changes": self._state_change_count,
+            "last_failure_time": (
+                None
+                if self._last_failure_at is None
+                else time.time() - (self._now() - self._last_failure_at)
+            ),
         }
 
     async def reset(self):
         """수동 리셋"""
-        async with self._lock:
+        async with self._state_lock:
             self._transition_to(CircuitBreakerState.CLOSED)
             logger.info(f"CircuitBreaker '{self.name}' manually reset")
 
@@ -267,9 +330,7 @@ class CircuitBreakerInterceptor(grpc.aio.UnaryUnaryClientInterceptor):
             state = self.circuit_breaker.state
 
             if state == CircuitBreakerState.OPEN:
-                reset_time = self.circuit_breaker.config.reset_timeout - (
-                    time.time() - (self.circuit_breaker._last_failure_time or 0)
-                )
+                reset_time = self.circuit_breaker.reset_remaining()
 
                 # Fallback이 있으면 실행
                 if self.fallback:
@@ -279,7 +340,7 @@ class CircuitBreakerInterceptor(grpc.aio.UnaryUnaryClientInterceptor):
                     return await self.fallback(request)
 
                 # Fallback 없으면 에러
-                raise CircuitBreakerOpenError(self.circuit_breaker.name, max(0, reset_time))
+                raise CircuitBreakerOpenError(self.circuit_breaker.name, reset_time)
 
             # HALF_OPEN에서 최대 호출 초과
             logger.warning(
@@ -329,10 +390,8 @@ class CircuitBreakerStreamInterceptor(grpc.aio.UnaryStreamClientInterceptor):
             state = self.circuit_breaker.state
 
             if state == CircuitBreakerState.OPEN:
-                reset_time = self.circuit_breaker.config.reset_timeout - (
-                    time.time() - (self.circuit_breaker._last_failure_time or 0)
-                )
-                raise CircuitBreakerOpenError(self.circuit_breaker.name, max(0, reset_time))
+                reset_time = self.circuit_breaker.reset_remaining()
+                raise CircuitBreakerOpenError(self.circuit_breaker.name, reset_time)
 
         try:
             response = await continuation(client_call_details, request)
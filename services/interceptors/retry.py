@@ -21,6 +21,17 @@ from grpc import StatusCode
 
 logger = logging.getLogger(__name__)
 
+# 재시도 판정 핫 패스에서 쓰는 상태 코드 (호출마다 Enum 속성 조회하지 않도록 한 번만 바인딩)
+_UNAVAILABLE = StatusCode.UNAVAILABLE
+
+# gRPC 서비스 설정 retryPolicy 의 maxAttempts 상한 (초과 값은 5로 취급됨)
+GRPC_MAX_RETRY_ATTEMPTS = 5
+
+
+def _format_duration(seconds: float) -> str:
+    """서비스 설정 duration 문자열 ("0.5s") - 작은 값도 지수 표기("1e-05s") 없이 고정소수점"""
+    return f"{seconds:.9f}".rstrip("0").rstrip(".") + "s"
+
 
 @dataclass
 class RetryPolicy:
@@ -32,25 +43,81 @@ class RetryPolicy:
     backoff_multiplier: float = 2.0
     jitter: float = 0.2
 
-    retryable_status_codes: set[StatusCode] = field(
-        default_factory=lambda: {
-            StatusCode.UNAVAILABLE,
-            StatusCode.DEADLINE_EXCEEDED,
-            StatusCode.RESOURCE_EXHAUSTED,
-            StatusCode.ABORTED,
-        }
+    retryable_status_codes: frozenset[StatusCode] = field(
+        default_factory=lambda: frozenset(
+            {
+                StatusCode.UNAVAILABLE,
+                StatusCode.DEADLINE_EXCEEDED,
+                StatusCode.RESOURCE_EXHAUSTED,
+                StatusCode.ABORTED,
+            }
+        )
     )
 
+    # 시도 횟수별 기본 backoff (jitter 적용 전) - 생성 시 한 번만 계산
+    _backoff_schedule: tuple[float, ...] = field(init=False, repr=False, compare=False)
+    # 가장 흔한 재시도 대상(UNAVAILABLE) 포함 여부 - 해시 조회 없이 판정
+    _retry_unavailable: bool = field(init=False, repr=False, compare=False)
 
-class RetryInterceptor(grpc.aio.UnaryUnaryClientInterceptor):
-    """
-    gRPC Client Interceptor for Retry with Exponential Backoff
+    def __post_init__(self):
+        self.retryable_status_codes = frozenset(self.retryable_status_codes)
+        self._retry_unavailable = _UNAVAILABLE in self.retryable_status_codes
+        self._backoff_schedule = tuple(
+            self._compute_backoff(attempt) for attempt in range(self.max_attempts)
+        )
+
+    def _compute_backoff(self, attempt: int) -> float:
+        return min(self.initial_backoff * (self.backoff_multiplier**attempt), self.max_backoff)
+
+    def base_backoff(self, attempt: int) -> float:
+        """attempt 번째 재시도의 기본 backoff"""
+        if attempt < len(self._backoff_schedule):
+            return self._backoff_schedule[attempt]
+        return self._compute_backoff(attempt)
+
+    def to_service_config(self) -> dict[str, Any] | None:
+        """gRPC 서비스 설정(retryPolicy)으로 변환 - C-core 가 직접 재시도
+
+        gRPC 가 표현할 수 없는 정책(maxAttempts 2~5 범위 밖, 0 이하 backoff,
+        재시도 코드 없음)이면 None 반환. jitter 는 gRPC 고유 방식이 적용됨.
+        """
+        if not 2 <= self.max_attempts <= GRPC_MAX_RETRY_ATTEMPTS:
+            return None
+        if self.initial_backoff < 1e-9 or self.max_backoff < 1e-9 or self.backoff_multiplier <= 0:
+            # duration 은 나노초 단위까지만 표현되므로 그보다 작은 backoff 도 표현 불가
+            return None
+        if not self.retryable_status_codes:
+            return None
+
+        return {
+            "methodConfig": [
+                {
+                    "name": [{}],  # 모든 서비스/메서드에 적용
+                    "retryPolicy": {
+                        "maxAttempts": self.max_attempts,
+                        "initialBackoff": _format_duration(self.initial_backoff),
+                        "maxBackoff": _format_duration(self.max_backoff),
+                        "backoffMultiplier": self.backoff_multiplier,
+                        "retryableStatusCodes": sorted(
+                            code.name for code in self.retryable_status_codes
+                        ),
+                    },
+                }
+            ]
+        }
+
+
+class _RetryBase:
+    """Unary/Stream 재시도 인터셉터 공통 구현
 
     gRPC 표준 backoff 알고리즘 적용:
     current_backoff = min(initial_backoff * (multiplier ^ attempt), max_backoff)
     sleep_time = current_backoff + uniform(-jitter * current_backoff, jitter * current_backoff)
     """
 
+    # 재시도 로그 접두어
+    _retry_label = "Retry"
+
     def __init__(
         self,
         policy: RetryPolicy | None = None,
@@ -64,24 +131,23 @@ class RetryInterceptor(grpc.aio.UnaryUnaryClientInterceptor):
 
     def _calculate_backoff(self, attempt: int) -> float:
         """Exponential backoff with jitter 계산"""
-        backoff = min(
-            self.policy.initial_backoff * (self.policy.backoff_multiplier**attempt),
-            self.policy.max_backoff,
-        )
+        backoff = self.policy.base_backoff(attempt)
         jitter_range = self.policy.jitter * backoff
         return backoff + random.uniform(-jitter_range, jitter_range)
 
     def _is_retryable(self, status_code: StatusCode) -> bool:
         """재시도 가능한 에러인지 확인"""
+        if status_code is _UNAVAILABLE:
+            return self.policy._retry_unavailable
         return status_code in self.policy.retryable_status_codes
 
-    async def intercept_unary_unary(
+    async def _retry_loop(
         self,
         continuation: Callable,
         client_call_details: grpc.aio.ClientCallDetails,
         request: Any,
     ) -> Any:
-        """Unary-Unary 요청 인터셉트 및 재시도"""
+        """continuation 호출을 정책에 따라 재시도"""
 
         last_exception: Exception | None = None
 
@@ -109,7 +175,7 @@ class RetryInterceptor(grpc.aio.UnaryUnaryClientInterceptor):
                     backoff = self._calculate_backoff(attempt)
 
                     logger.warning(
-                        f"Retry {attempt + 1}/{self.policy.max_attempts} for "
+                        f"{self._retry_label} {attempt + 1}/{self.policy.max_attempts} for "
                         f"{client_call_details.method} after {e.code()}, "
                         f"waiting {backoff:.2f}s"
                     )
@@ -143,31 +209,29 @@ class RetryInterceptor(grpc.aio.UnaryUnaryClientInterceptor):
         }
 
 
-class RetryStreamInterceptor(grpc.aio.UnaryStreamClientInterceptor):
+class RetryInterceptor(_RetryBase, grpc.aio.UnaryUnaryClientInterceptor):
     """
-    gRPC Client Interceptor for Retry (Streaming)
-
-    스트리밍의 경우 전체 스트림 재시도
+    gRPC Client Interceptor for Retry with Exponential Backoff
     """
 
-    def __init__(
+    async def intercept_unary_unary(
         self,
-        policy: RetryPolicy | None = None,
-        on_retry: Callable[[int, Exception, float], None] | None = None,
-    ):
-        self.policy = policy or RetryPolicy()
-        self.on_retry = on_retry
+        continuation: Callable,
+        client_call_details: grpc.aio.ClientCallDetails,
+        request: Any,
+    ) -> Any:
+        """Unary-Unary 요청 인터셉트 및 재시도"""
+        return await self._retry_loop(continuation, client_call_details, request)
 
-    def _calculate_backoff(self, attempt: int) -> float:
-        backoff = min(
-            self.policy.initial_backoff * (self.policy.backoff_multiplier**attempt),
-            self.policy.max_backoff,
-        )
-        jitter_range = self.policy.jitter * backoff
-        return backoff + random.uniform(-jitter_range, jitter_range)
 
-    def _is_retryable(self, status_code: StatusCode) -> bool:
-        return status_code in self.policy.retryable_status_codes
+class RetryStreamInterceptor(_RetryBase, grpc.aio.UnaryStreamClientInterceptor):
+    """
+    gRPC Client Interceptor for Retry (Streaming)
+
+    스트리밍의 경우 전체 스트림 재시도
+    """
+
+    _retry_label = "Stream retry"
 
     async def intercept_unary_stream(
         self,
@@ -176,34 +240,4 @@ class RetryStreamInterceptor(grpc.aio.UnaryStreamClientInterceptor):
         request: Any,
     ) -> Any:
         """Unary-Stream 요청 인터셉트 및 재시도"""
-
-        last_exception: Exception | None = None
-
-        for attempt in range(self.policy.max_attempts):
-            try:
-                response = await continuation(client_call_details, request)
-                return response
-
-            except grpc.aio.AioRpcError as e:
-                last_exception = e
-
-                if not self._is_retryable(e.code()):
-                    raise
-
-                if attempt < self.policy.max_attempts - 1:
-                    backoff = self._calculate_backoff(attempt)
-
-                    logger.warning(
-                        f"Stream retry {attempt + 1}/{self.policy.max_attempts} for "
-                        f"{client_call_details.method}, waiting {backoff:.2f}s"
-                    )
-
-                    if self.on_retry:
-                        self.on_retry(attempt + 1, e, backoff)
-
-                    await asyncio.sleep(backoff)
-
-        if last_exception:
-            raise last_exception
-
-        raise RuntimeError("Unexpected retry loop exit")
+        return await self._retry_loop(continuation, client_call_details, request)
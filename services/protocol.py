@@ -2,12 +2,74 @@
 JSON-RPC 2.0 프로토콜 구현
 """
 
+import itertools
 import json
+import os
 import struct
 import uuid
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from enum import IntEnum
-from typing import Any
+from functools import partial
+from typing import Any, ClassVar
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 선택 의존성
+    orjson = None
+
+# 요청 ID - 프로세스별 접두사 + 단조 증가 카운터 (요청마다 uuid4 를 만들지 않음)
+_req_counter = itertools.count()
+_proc_prefix = ""
+
+
+def _reset_request_ids():
+    """접두사/카운터 초기화 (fork 된 자식이 부모와 같은 ID 를 만들지 않게 함)"""
+    global _req_counter, _proc_prefix
+    _req_counter = itertools.count()
+    _proc_prefix = f"{os.getpid():x}-{uuid.uuid4().hex[:8]}-"
+
+
+_reset_request_ids()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_request_ids)
+
+
+def _new_request_id() -> str:
+    return f"{_proc_prefix}{next(_req_counter):x}"
+
+
+# 프레임 헤더 (4바이트 big-endian 길이) - 포맷 문자열을 한 번만 파싱
+_HDR = struct.Struct(">I")
+# 프레임마다 호출되므로 메서드를 미리 바인딩해 속성 조회를 생략
+_pack_header = _HDR.pack
+_pack_header_into = _HDR.pack_into
+_unpack_header = _HDR.unpack_from
+
+# 최대 메시지 크기 (프레임마다 클래스 속성을 조회하지 않도록 모듈 상수로 둠)
+_MAX_MESSAGE_SIZE = 10 * 1024 * 1024  # 10MB
+
+# JSON 인코더 - orjson > json 순으로 사용, 모두 bytes 반환
+# 핸들러가 공유하는 읽기 전용 결과(MappingProxyType)는 default=dict 로 인코딩
+if orjson is not None:
+    _json_encode = partial(orjson.dumps, default=dict)
+else:  # pragma: no cover - 선택 의존성
+
+    def _json_encode(data: Any) -> bytes:
+        return json.dumps(data, default=dict).encode("utf-8")
+
+
+# JSON 디코더 - bytes/memoryview 를 그대로 받음 (별도 UTF-8 디코딩 불필요)
+# 핸들러가 params 를 dict 로 수정/전달하므로 지연 파싱 객체(cysimdjson 등)가 아닌
+# 실제 dict 를 반환하는 orjson 을 사용
+if orjson is not None:
+    _json_decode = orjson.loads
+else:  # pragma: no cover - 선택 의존성
+
+    def _json_decode(payload: bytes | bytearray | memoryview) -> Any:
+        # json.loads 는 memoryview 를 받지 않음
+        if isinstance(payload, memoryview):
+            payload = payload.tobytes()
+        return json.loads(payload)
 
 
 class ErrorCode(IntEnum):
@@ -24,32 +86,86 @@ class ErrorCode(IntEnum):
     CIRCUIT_OPEN = -32002
 
 
-@dataclass
+# 에러 코드별 고정 메시지 (JSON-RPC 2.0 표준 메시지 + 서버 정의 메시지)
+_ERROR_MESSAGES: dict[int, str] = {
+    ErrorCode.PARSE_ERROR: "Parse error",
+    ErrorCode.INVALID_REQUEST: "Invalid Request",
+    ErrorCode.METHOD_NOT_FOUND: "Method not found",
+    ErrorCode.INVALID_PARAMS: "Invalid params",
+    ErrorCode.INTERNAL_ERROR: "Internal error",
+    ErrorCode.SERVICE_UNAVAILABLE: "Service unavailable",
+    ErrorCode.TIMEOUT: "Request timeout",
+    ErrorCode.CIRCUIT_OPEN: "Circuit breaker open",
+}
+
+# 에러 응답 템플릿 - to_dict() 키 순서(jsonrpc, id, error)대로 id 앞뒤를 미리 직렬화
+# 고정 메시지에 대해서만 한 번 만들어 두고, 동적 메시지는 일반 인코딩 경로를 사용
+_ERROR_PREFIX = b'{"jsonrpc":"2.0","id":'
+_ERROR_TEMPLATES: dict[int, tuple[str, bytes]] = {
+    code: (
+        message,
+        b',"error":' + _json_encode({"code": int(code), "message": message}) + b"}",
+    )
+    for code, message in _ERROR_MESSAGES.items()
+}
+
+
+@dataclass(slots=True)
 class JsonRpcRequest:
     """JSON-RPC 2.0 요청"""
 
     method: str
     params: dict[str, Any] = field(default_factory=dict)
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_request_id)
     jsonrpc: str = "2.0"
 
+    # 서버 수신 경로에서 재사용할 요청 객체 free-list
+    _pool: ClassVar[list["JsonRpcRequest"]] = []
+    POOL_MAX_SIZE: ClassVar[int] = 1024
+
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        # asdict() 는 params 를 재귀적으로 deepcopy 하므로 직접 구성
+        return {
+            "jsonrpc": self.jsonrpc,
+            "method": self.method,
+            "params": self.params,
+            "id": self.id,
+        }
 
     def to_bytes(self) -> bytes:
-        return json.dumps(self.to_dict()).encode("utf-8")
+        return _json_encode(self.to_dict())
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "JsonRpcRequest":
         return cls(
             method=data.get("method", ""),
             params=data.get("params", {}),
-            id=data.get("id", str(uuid.uuid4())),
+            id=data["id"] if "id" in data else _new_request_id(),
             jsonrpc=data.get("jsonrpc", "2.0"),
         )
 
+    @classmethod
+    def acquire(cls, data: dict[str, Any]) -> "JsonRpcRequest":
+        """free-list 에서 요청 객체를 꺼내 data 로 채움 (from_dict 와 동일한 기본값)
+
+        사용이 끝나면 release() 로 반환해야 함
+        """
+        obj = cls._pool.pop() if cls._pool else object.__new__(cls)
+        obj.method = data.get("method", "")
+        obj.params = data.get("params", {})
+        obj.id = data["id"] if "id" in data else _new_request_id()
+        obj.jsonrpc = data.get("jsonrpc", "2.0")
+        return obj
 
-@dataclass
+    @classmethod
+    def release(cls, obj: "JsonRpcRequest"):
+        """요청 객체를 free-list 로 반환"""
+        if len(cls._pool) < cls.POOL_MAX_SIZE:
+            obj.params = None
+            cls._pool.append(obj)
+
+
+@dataclass(slots=True)
 class JsonRpcError:
     """JSON-RPC 에러"""
 
@@ -64,7 +180,7 @@ class JsonRpcError:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class JsonRpcResponse:
     """JSON-RPC 2.0 응답"""
 
@@ -82,7 +198,13 @@ class JsonRpcResponse:
         return response
 
     def to_bytes(self) -> bytes:
-        return json.dumps(self.to_dict()).encode("utf-8")
+        error = self.error
+        if error is not None and error.data is None and self.jsonrpc == "2.0":
+            # 고정 메시지 에러 응답은 id 만 직렬화해서 템플릿 사이에 끼워 넣음
+            template = _ERROR_TEMPLATES.get(error.code)
+            if template is not None and template[0] == error.message:
+                return _ERROR_PREFIX + _json_encode(self.id) + template[1]
+        return _json_encode(self.to_dict())
 
     @classmethod
     def success(cls, id: str, result: Any) -> "JsonRpcResponse":
@@ -121,28 +243,55 @@ class MessageFramer:
     └────────────────┴────────────────────────────────────┘
     """
 
-    HEADER_SIZE = 4
-    MAX_MESSAGE_SIZE = 10 * 1024 * 1024  # 10MB
+    HEADER_SIZE = _HDR.size
+    MAX_MESSAGE_SIZE = _MAX_MESSAGE_SIZE
 
     @staticmethod
     def encode(data: dict | bytes) -> bytes:
         """메시지 인코딩"""
-        payload = json.dumps(data).encode("utf-8") if isinstance(data, dict) else data
+        length, payload = MessageFramer.encode_parts(data)
+        return length + payload
 
-        if len(payload) > MessageFramer.MAX_MESSAGE_SIZE:
-            raise ValueError(f"Message too large: {len(payload)} bytes")
+    @staticmethod
+    def encode_parts(data: dict | bytes) -> tuple[bytes, bytes]:
+        """메시지 인코딩 (헤더와 페이로드를 분리해서 반환)
 
-        length = struct.pack(">I", len(payload))
-        return length + payload
+        writer.writelines((header, payload)) 로 전송하면 헤더+페이로드
+        연결 복사 없이 전송할 수 있음
+        """
+        payload = _json_encode(data) if isinstance(data, dict) else data
+        n = len(payload)
+        if n > _MAX_MESSAGE_SIZE:
+            raise ValueError(f"Message too large: {n} bytes")
+
+        return _pack_header(n), payload
+
+    @staticmethod
+    def encode_into(buffer: bytearray, data: dict | bytes) -> None:
+        """메시지를 buffer 끝에 이어서 기록 (여러 프레임을 한 번에 write 할 때 사용)"""
+        payload = _json_encode(data) if isinstance(data, dict) else data
+        n = len(payload)
+        if n > _MAX_MESSAGE_SIZE:
+            raise ValueError(f"Message too large: {n} bytes")
+
+        offset = len(buffer)
+        buffer.extend(b"\0\0\0\0")
+        _pack_header_into(buffer, offset, n)
+        buffer += payload
+
+    @staticmethod
+    def encode_header(length: int) -> bytes:
+        """메시지 길이로 헤더 생성"""
+        return _pack_header(length)
 
     @staticmethod
-    def decode_header(header: bytes) -> int:
+    def decode_header(header: bytes | bytearray | memoryview) -> int:
         """헤더에서 메시지 길이 추출"""
         if len(header) != MessageFramer.HEADER_SIZE:
             raise ValueError(f"Invalid header size: {len(header)}")
-        return struct.unpack(">I", header)[0]
+        return _unpack_header(header)[0]
 
     @staticmethod
-    def decode_payload(payload: bytes) -> dict[str, Any]:
-        """페이로드 디코딩"""
-        return json.loads(payload.decode("utf-8"))
+    def decode_payload(payload: bytes | bytearray | memoryview) -> dict[str, Any]:
+        """페이로드 디코딩 (큰 버퍼의 일부는 memoryview 로 잘라 복사 없이 전달)"""
+        return _json_decode(payload)
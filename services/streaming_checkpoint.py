@@ -9,16 +9,53 @@ Phase 3: Resilience
 """
 
 import asyncio
+import json
 import logging
 import time
-from collections.abc import AsyncIterator, Callable
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Mapping
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 선택 의존성
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# 락 샤드 수 - 서로 다른 스트림은 대부분 다른 샤드에 배정되어 서로 기다리지 않음
+N_SHARDS = 16
+
+# 스트림별로 보관할 최근 체크포인트 수 (재개에는 마지막 것만 사용)
+MAX_CHECKPOINTS_PER_STREAM = 8
+
+# 적응형 체크포인트 간격에서 메시지 속도 EMA 가중치
+RATE_EMA_ALPHA = 0.3
+
+# metadata 가 없는 체크포인트가 공유하는 읽기 전용 빈 매핑 (체크포인트마다 dict 를 만들지 않음)
+_EMPTY_META = MappingProxyType({})
+
 
-@dataclass
+def _encode_checkpoints(batch: list["StreamCheckpoint"]) -> bytes:
+    """체크포인트 묶음을 JSON Lines 로 직렬화"""
+    if orjson is not None:
+        return b"".join(orjson.dumps(cp, default=dict) + b"\n" for cp in batch)
+    else:  # pragma: no cover - 선택 의존성
+        lines = (
+            json.dumps({name: getattr(cp, name) for name in cp.__slots__}, default=dict)
+            for cp in batch
+        )
+        return "".join(line + "\n" for line in lines).encode("utf-8")
+
+
+def _append_file(path: str, data: bytes):
+    with open(path, "ab") as f:
+        f.write(data)
+
+
+@dataclass(slots=True)
 class StreamCheckpoint:
     """스트림 체크포인트"""
 
@@ -27,19 +64,25 @@ class StreamCheckpoint:
     last_content: str
     progress_percent: float
     timestamp: float
-    metadata: dict[str, Any] = field(default_factory=dict)
+    metadata: Mapping[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamState:
     """스트림 상태"""
 
     stream_id: str
     started_at: float
-    checkpoints: list[StreamCheckpoint] = field(default_factory=list)
+    checkpoints: deque[StreamCheckpoint] = field(
+        default_factory=lambda: deque(maxlen=MAX_CHECKPOINTS_PER_STREAM)
+    )
     completed: bool = False
     error: str | None = None
     total_messages: int = 0
+    # 적응형 간격 계산용 (마지막 체크포인트 시각은 monotonic 기준)
+    last_checkpoint_sequence: int = -1
+    last_checkpoint_at: float = 0.0
+    ema_rate: float = 0.0
 
     @property
     def last_checkpoint(self) -> StreamCheckpoint | None:
@@ -58,27 +101,60 @@ class StreamCheckpointManager:
         checkpoint_interval: int = 10,
         max_streams: int = 100,
         ttl: float = 3600.0,
+        checkpoint_target_seconds: float | None = None,
+        persist_path: str | None = None,
+        persist_batch_size: int = 64,
+        persist_max_delay: float = 1.0,
     ):
+        """
+        Args:
+            checkpoint_target_seconds: 지정하면 간격을 스트림 속도에 맞춤 -
+                빠른 스트림은 약 이 시간 분량의 메시지마다(최소 checkpoint_interval),
+                느린 스트림은 이 시간이 지나면 다음 메시지에서 체크포인트
+            persist_path: 지정하면 체크포인트를 JSON Lines 로 이 파일에 추가 기록 -
+                persist_batch_size 개가 모이거나 persist_max_delay 초가 지나면
+                한 번의 write 로 묶어서 기록 (종료 시 flush() 호출)
+        """
         self.checkpoint_interval = checkpoint_interval
         self.max_streams = max_streams
         self.ttl = ttl
+        self.checkpoint_target_seconds = checkpoint_target_seconds
+        self.persist_path = persist_path
+        self.persist_batch_size = persist_batch_size
+        self.persist_max_delay = persist_max_delay
 
-        self._streams: dict[str, StreamState] = {}
-        self._lock = asyncio.Lock()
+        # 기록 대기 중인 체크포인트
+        self._pending: deque[StreamCheckpoint] = deque()
+        self._last_flush = time.monotonic()
+
+        # stream_id 해시로 샤드를 고르고, 각 샤드는 자기 락으로만 보호
+        self._shards: list[dict[str, StreamState]] = [{} for _ in range(N_SHARDS)]
+        self._shard_locks = [asyncio.Lock() for _ in range(N_SHARDS)]
+
+    @staticmethod
+    def _shard(stream_id: str) -> int:
+        return hash(stream_id) % N_SHARDS
+
+    def _stream_count(self) -> int:
+        return sum(len(shard) for shard in self._shards)
 
     async def start_stream(self, stream_id: str) -> StreamState:
         """스트림 시작"""
-        async with self._lock:
+        index = self._shard(stream_id)
+        async with self._shard_locks[index]:
+            # 정리/제거는 await 없이 끝나므로 다른 샤드를 건드려도 중간에 끼어들 수 없음
             await self._cleanup_expired()
 
-            if len(self._streams) >= self.max_streams:
+            # 같은 ID 를 다시 시작하면 뒤로 옮겨서 샤드 dict 가 시작 시각 순서를 유지하게 함
+            shard = self._shards[index]
+            if shard.pop(stream_id, None) is None and self._stream_count() >= self.max_streams:
                 await self._evict_oldest()
 
             state = StreamState(
                 stream_id=stream_id,
                 started_at=time.time(),
             )
-            self._streams[stream_id] = state
+            shard[stream_id] = state
 
             logger.debug(f"Stream started: {stream_id}")
             return state
@@ -92,83 +168,166 @@ class StreamCheckpointManager:
         metadata: dict[str, Any] | None = None,
     ) -> StreamCheckpoint | None:
         """체크포인트 저장"""
-        async with self._lock:
-            state = self._streams.get(stream_id)
-            if not state:
-                return None
-
-            state.total_messages = sequence + 1
-
-            if sequence % self.checkpoint_interval == 0 or progress_percent >= 100:
-                checkpoint = StreamCheckpoint(
-                    stream_id=stream_id,
-                    last_sequence=sequence,
-                    last_content=content,
-                    progress_percent=progress_percent,
-                    timestamp=time.time(),
-                    metadata=metadata or {},
-                )
-                state.checkpoints.append(checkpoint)
+        state = self._shards[self._shard(stream_id)].get(stream_id)
+        if not state:
+            return None
+        return await self.checkpoint_on_state(state, sequence, content, progress_percent, metadata)
 
-                logger.debug(
-                    f"Checkpoint saved: {stream_id} seq={sequence} progress={progress_percent:.1f}%"
-                )
-                return checkpoint
+    async def checkpoint_on_state(
+        self,
+        state: StreamState,
+        sequence: int,
+        content: str,
+        progress_percent: float,
+        metadata: dict[str, Any] | None = None,
+    ) -> StreamCheckpoint | None:
+        """체크포인트 저장 (start_stream 이 돌려준 상태 객체에 직접 기록)
 
+        대부분의 메시지는 체크포인트 대상이 아니므로 락 없이 판정하고,
+        실제로 체크포인트를 추가할 때만 샤드 락을 잡음
+        (스트림마다 생산자 코루틴이 하나라 total_messages 는 경쟁 없이 기록됨)
+        """
+        state.total_messages = sequence + 1
+
+        if self.checkpoint_target_seconds is None:
+            due = sequence % self.checkpoint_interval == 0
+        else:
+            due = self._adaptive_due(state, sequence)
+        if not due and progress_percent < 100:
             return None
 
+        stream_id = state.stream_id
+        async with self._shard_locks[self._shard(stream_id)]:
+            self._update_rate(state, sequence)
+            checkpoint = StreamCheckpoint(
+                stream_id=stream_id,
+                last_sequence=sequence,
+                last_content=content,
+                progress_percent=progress_percent,
+                timestamp=time.time(),
+                metadata=metadata if metadata else _EMPTY_META,
+            )
+            state.checkpoints.append(checkpoint)
+
+            logger.debug(
+                f"Checkpoint saved: {stream_id} seq={sequence} progress={progress_percent:.1f}%"
+            )
+
+        if self.persist_path is not None:
+            self._pending.append(checkpoint)
+            if (
+                len(self._pending) >= self.persist_batch_size
+                or time.monotonic() - self._last_flush >= self.persist_max_delay
+            ):
+                await self.flush()
+
+        return checkpoint
+
+    async def flush(self):
+        """대기 중인 체크포인트를 파일에 한 번에 기록"""
+        self._last_flush = time.monotonic()
+        if not self._pending or self.persist_path is None:
+            return
+
+        batch = list(self._pending)
+        self._pending.clear()
+        await asyncio.to_thread(_append_file, self.persist_path, _encode_checkpoints(batch))
+
+    def _adaptive_due(self, state: StreamState, sequence: int) -> bool:
+        """적응형 간격으로 체크포인트 시점인지 판정"""
+        if state.last_checkpoint_sequence < 0:
+            return True
+
+        target = self.checkpoint_target_seconds
+        since = sequence - state.last_checkpoint_sequence
+        if since >= max(self.checkpoint_interval, int(state.ema_rate * target)):
+            return True
+        return time.monotonic() - state.last_checkpoint_at >= target
+
+    @staticmethod
+    def _update_rate(state: StreamState, sequence: int):
+        """직전 체크포인트 이후 메시지 속도로 EMA 갱신"""
+        now = time.monotonic()
+        if state.last_checkpoint_sequence >= 0:
+            elapsed = now - state.last_checkpoint_at
+            if elapsed > 0:
+                rate = (sequence - state.last_checkpoint_sequence) / elapsed
+                state.ema_rate = (
+                    rate
+                    if state.ema_rate == 0.0
+                    else RATE_EMA_ALPHA * rate + (1 - RATE_EMA_ALPHA) * state.ema_rate
+                )
+        state.last_checkpoint_sequence = sequence
+        state.last_checkpoint_at = now
+
     async def get_resume_point(self, stream_id: str) -> StreamCheckpoint | None:
         """재개 지점 조회"""
-        async with self._lock:
-            state = self._streams.get(stream_id)
+        index = self._shard(stream_id)
+        async with self._shard_locks[index]:
+            state = self._shards[index].get(stream_id)
             if state and state.can_resume:
                 return state.last_checkpoint
             return None
 
     async def complete_stream(self, stream_id: str):
         """스트림 완료"""
-        async with self._lock:
-            state = self._streams.get(stream_id)
+        index = self._shard(stream_id)
+        async with self._shard_locks[index]:
+            state = self._shards[index].get(stream_id)
             if state:
                 state.completed = True
                 logger.debug(f"Stream completed: {stream_id}")
 
     async def fail_stream(self, stream_id: str, error: str):
         """스트림 실패"""
-        async with self._lock:
-            state = self._streams.get(stream_id)
+        index = self._shard(stream_id)
+        async with self._shard_locks[index]:
+            state = self._shards[index].get(stream_id)
             if state:
                 state.error = error
                 logger.warning(f"Stream failed: {stream_id} - {error}")
 
     async def get_state(self, stream_id: str) -> StreamState | None:
         """스트림 상태 조회"""
-        async with self._lock:
-            return self._streams.get(stream_id)
+        index = self._shard(stream_id)
+        async with self._shard_locks[index]:
+            return self._shards[index].get(stream_id)
 
     async def _cleanup_expired(self):
-        """만료된 스트림 정리"""
-        now = time.time()
-        expired = [sid for sid, state in self._streams.items() if now - state.started_at > self.ttl]
-        for sid in expired:
-            del self._streams[sid]
+        """만료된 스트림 정리
+
+        샤드 dict 는 시작 순서대로 정렬되어 있으므로 만료되지 않은 첫 스트림에서 멈춤
+        """
+        deadline = time.time() - self.ttl
+        for shard in self._shards:
+            while shard:
+                sid = next(iter(shard))
+                if shard[sid].started_at >= deadline:
+                    break
+                del shard[sid]
 
     async def _evict_oldest(self):
-        """가장 오래된 스트림 제거"""
-        if not self._streams:
-            return
-
-        oldest = min(self._streams.keys(), key=lambda k: self._streams[k].started_at)
-        del self._streams[oldest]
+        """가장 오래된 스트림 제거 (각 샤드의 첫 항목만 비교)"""
+        oldest_shard = None
+        oldest_at = 0.0
+        for shard in self._shards:
+            if shard:
+                started_at = shard[next(iter(shard))].started_at
+                if oldest_shard is None or started_at < oldest_at:
+                    oldest_shard, oldest_at = shard, started_at
+
+        if oldest_shard is not None:
+            del oldest_shard[next(iter(oldest_shard))]
 
     def get_stats(self) -> dict[str, Any]:
         """통계"""
-        active = sum(1 for s in self._streams.values() if not s.completed)
-        completed = sum(1 for s in self._streams.values() if s.completed)
-        failed = sum(1 for s in self._streams.values() if s.error)
+        states = [state for shard in self._shards for state in shard.values()]
+        active = sum(1 for s in states if not s.completed)
+        completed = sum(1 for s in states if s.completed)
+        failed = sum(1 for s in states if s.error)
 
         return {
-            "total_streams": len(self._streams),
+            "total_streams": len(states),
             "active_streams": active,
             "completed_streams": completed,
             "failed_streams": failed,
@@ -208,15 +367,21 @@ class ResumableStreamWrapper:
         else:
             stream = self.stream_factory()
 
+        # 한 스트림의 메시지는 같은 타입이므로 속성 유무는 첫 메시지에서 한 번만 확인
+        # (getattr 기본값으로 쓰던 str(message) 를 매번 만들지 않음)
+        has_content = has_progress = None
         try:
             async for message in stream:
                 self._sequence += 1
 
-                content = getattr(message, "content", str(message))
-                progress = getattr(message, "progress_percent", 0)
+                if has_content is None:
+                    has_content = hasattr(message, "content")
+                    has_progress = hasattr(message, "progress_percent")
+                content = message.content if has_content else str(message)
+                progress = message.progress_percent if has_progress else 0
 
-                await self.checkpoint_manager.checkpoint(
-                    self.stream_id,
+                await self.checkpoint_manager.checkpoint_on_state(
+                    self._state,
                     self._sequence,
                     content,
                     progress,
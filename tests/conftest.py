@@ -4,7 +4,6 @@ Comprehensive Test Suite for Synaps AI Agent System
 """
 
 import asyncio
-from dataclasses import dataclass
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -12,17 +11,24 @@ import grpc
 import pytest
 from grpc import StatusCode
 
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - 선택 의존성
+    uvloop = None
+
 # ============================================================================
 # Async Event Loop Configuration
 # ============================================================================
 
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+# pytest-asyncio 1.x no longer uses an overridden event_loop fixture; loops come
+# from this hook instead. Without uvloop the plugin's default asyncio loop is used.
+if uvloop is not None:
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories(config, item):
+        """Run async tests on uvloop when it is installed."""
+        return {"uvloop": uvloop.new_event_loop}
 
 
 # ============================================================================
@@ -30,19 +36,24 @@ def event_loop():
 # ============================================================================
 
 
-@dataclass
-class MockClientCallDetails:
-    """Mock gRPC client call details."""
-
-    method: str = "/test.Service/Method"
-    timeout: float | None = None
-    metadata: tuple | None = None
-    credentials: Any | None = None
-    wait_for_ready: bool | None = None
+def MockClientCallDetails(
+    method: str = "/test.Service/Method",
+    timeout: float | None = None,
+    metadata: tuple | None = None,
+    credentials: Any | None = None,
+    wait_for_ready: bool | None = None,
+) -> grpc.aio.ClientCallDetails:
+    """Mock gRPC client call details (real grpc.aio namedtuple with test defaults)."""
+    return grpc.aio.ClientCallDetails(method, timeout, metadata, credentials, wait_for_ready)
 
 
 class MockAioRpcError(grpc.aio.AioRpcError):
-    """Mock gRPC async RPC error for testing."""
+    """Mock gRPC async RPC error for testing.
+
+    Must stay a real subclass: the interceptors use ``except grpc.aio.AioRpcError``
+    and AioRpcError is not an ABC, so a duck-typed or registered class would not
+    be caught. The parent constructor is deliberately not called.
+    """
 
     def __init__(self, code: StatusCode, details: str = "Mock error"):
         self._code = code
@@ -58,6 +69,19 @@ class MockAioRpcError(grpc.aio.AioRpcError):
         return f"MockAioRpcError({self._code}, {self._details})"
 
 
+class FakeClock:
+    """Manually advanced monotonic clock for time-dependent state machines."""
+
+    def __init__(self, start: float = 1000.0):
+        self._now = start
+
+    def now(self) -> float:
+        return self._now
+
+    def advance(self, seconds: float):
+        self._now += seconds
+
+
 @pytest.fixture
 def mock_call_details():
     """Fixture for mock gRPC call details."""
@@ -134,9 +158,9 @@ def mock_intermittent_continuation():
 # ============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def circuit_breaker_config():
-    """Default circuit breaker configuration for testing."""
+    """Default circuit breaker configuration for testing (read-only, shared per module)."""
     from services.interceptors.circuit_breaker import CircuitBreakerConfig
 
     return CircuitBreakerConfig(
@@ -148,11 +172,25 @@ def circuit_breaker_config():
 
 
 @pytest.fixture
-def circuit_breaker(circuit_breaker_config):
-    """Pre-configured circuit breaker instance."""
+def fake_clock():
+    """Fake monotonic clock; advance it instead of sleeping through reset_timeout."""
+    return FakeClock()
+
+
+@pytest.fixture
+def circuit_breaker(circuit_breaker_config, fake_clock):
+    """Pre-configured circuit breaker instance driven by fake_clock."""
     from services.interceptors.circuit_breaker import CircuitBreaker
 
-    return CircuitBreaker("test-service", circuit_breaker_config)
+    return CircuitBreaker("test-service", circuit_breaker_config, time_fn=fake_clock.now)
+
+
+@pytest.fixture
+async def opened_breaker(circuit_breaker):
+    """circuit_breaker already tripped to OPEN by failure_threshold failures."""
+    for _ in range(circuit_breaker.config.failure_threshold):
+        await circuit_breaker.record_failure(StatusCode.UNAVAILABLE)
+    return circuit_breaker
 
 
 # ============================================================================
@@ -187,9 +225,9 @@ def retry_interceptor(retry_policy):
 # ============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def timeout_config():
-    """Default timeout configuration for testing."""
+    """Default timeout configuration for testing (read-only, shared per module)."""
     from services.interceptors.adaptive_timeout import TimeoutConfig
 
     return TimeoutConfig(
@@ -211,6 +249,14 @@ def timeout_manager(timeout_config):
     return TimeoutManager(timeout_config)
 
 
+@pytest.fixture(scope="module")
+def shared_timeout_manager(timeout_config):
+    """Timeout manager shared by tests that never record samples or read cache stats."""
+    from services.interceptors.adaptive_timeout import TimeoutManager
+
+    return TimeoutManager(timeout_config)
+
+
 # ============================================================================
 # Fallback Fixtures
 # ============================================================================
@@ -460,7 +506,11 @@ def mock_time():
 
 @pytest.fixture(autouse=True)
 async def cleanup_async():
-    """Cleanup any lingering async resources after each test."""
+    """Cancel any tasks a test left running (returns immediately when there are none)."""
     yield
-    # Give a small window for cleanup
-    await asyncio.sleep(0.01)
+    current = asyncio.current_task()
+    pending = [t for t in asyncio.all_tasks() if t is not current and not t.done()]
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
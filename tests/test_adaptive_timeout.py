@@ -1,10 +1,7 @@
-import sys
-from pathlib import Path
+import asyncio
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from services.interceptors.adaptive_timeout import (
     AdaptiveTimeoutInterceptor,
     TimeoutConfig,
@@ -32,108 +29,192 @@ class TestTimeoutConfig:
 
 
 class TestTimeoutManager:
-    @pytest.mark.asyncio
-    async def test_returns_default_timeout_for_unknown_method(self, timeout_manager):
-        timeout = await timeout_manager.get_timeout("UnknownMethod")
+    async def test_returns_default_timeout_for_unknown_method(self, shared_timeout_manager):
+        timeout = await shared_timeout_manager.get_timeout("UnknownMethod")
 
-        assert timeout == timeout_manager.config.default_timeout
+        assert timeout == shared_timeout_manager.config.default_timeout
 
-    @pytest.mark.asyncio
-    async def test_returns_method_specific_timeout(self, timeout_manager):
-        timeout = await timeout_manager.get_timeout("/service/HealthCheck")
+    async def test_returns_method_specific_timeout(self, shared_timeout_manager):
+        timeout = await shared_timeout_manager.get_timeout("/service/HealthCheck")
 
-        assert timeout == timeout_manager.config.method_timeouts["HealthCheck"]
+        assert timeout == shared_timeout_manager.config.method_timeouts["HealthCheck"]
 
-    @pytest.mark.asyncio
     async def test_records_response_time(self, timeout_manager):
-        await timeout_manager.record_response_time("TestMethod", 1.0)
-        await timeout_manager.record_response_time("TestMethod", 2.0)
+        timeout_manager.record_response_time("TestMethod", 1.0)
+        timeout_manager.record_response_time("TestMethod", 2.0)
 
         assert len(timeout_manager._response_times["TestMethod"]) == 2
 
-    @pytest.mark.asyncio
+    async def test_concurrent_records_are_all_applied(self, timeout_manager):
+        async def record(start):
+            for i in range(start, start + 5):
+                timeout_manager.record_response_time("TestMethod", float(i))
+                await asyncio.sleep(0)
+
+        await asyncio.gather(*(record(start) for start in range(0, 20, 5)))
+
+        history = timeout_manager._response_times["TestMethod"]
+        assert sorted(history) == [float(i) for i in range(20)]
+        metrics = timeout_manager.get_metrics()["TestMethod"]
+        assert metrics["count"] == 20
+        assert metrics["avg"] == 9.5
+        assert metrics["p95"] == 19.0
+
     async def test_adaptive_timeout_with_history(self, timeout_manager):
         for i in range(15):
-            await timeout_manager.record_response_time("TestMethod", 1.0 + i * 0.1)
+            timeout_manager.record_response_time("TestMethod", 1.0 + i * 0.1)
 
         timeout = await timeout_manager.get_timeout("TestMethod")
 
         assert timeout >= timeout_manager.config.min_timeout
         assert timeout <= timeout_manager.config.max_timeout
 
-    @pytest.mark.asyncio
     async def test_history_size_limit(self, timeout_manager):
         for i in range(30):
-            await timeout_manager.record_response_time("TestMethod", float(i))
+            timeout_manager.record_response_time("TestMethod", float(i))
 
         assert (
             len(timeout_manager._response_times["TestMethod"])
             == timeout_manager.config.history_size
         )
 
-    @pytest.mark.asyncio
+    async def test_history_keeps_most_recent_values(self, timeout_manager):
+        for i in range(30):
+            timeout_manager.record_response_time("TestMethod", float(i))
+
+        history = timeout_manager._response_times["TestMethod"]
+        assert history[0] == 30 - timeout_manager.config.history_size
+        assert history[-1] == 29.0
+
+    async def test_sorted_history_tracks_evictions(self, timeout_manager):
+        for i in range(30, 0, -1):
+            timeout_manager.record_response_time("TestMethod", float(i))
+
+        history = timeout_manager._response_times["TestMethod"]
+        assert list(timeout_manager._sorted_times["TestMethod"]) == sorted(history)
+
+    def test_bisect_list_fallback(self):
+        from services.interceptors.adaptive_timeout import _BisectList
+
+        values = _BisectList()
+        for v in (3.0, 1.0, 2.0, 2.0):
+            values.add(v)
+        values.remove(2.0)
+
+        assert values == [1.0, 2.0, 3.0]
+
+    def test_sample_rate_records_one_in_n_per_method(self):
+        manager = TimeoutManager(TimeoutConfig(sample_rate=4))
+
+        for i in range(8):
+            manager.record_response_time("MethodA", float(i))
+            manager.record_response_time("MethodB", float(i))
+
+        assert list(manager._response_times["MethodA"]) == [0.0, 4.0]
+        assert list(manager._response_times["MethodB"]) == [0.0, 4.0]
+
+    async def test_timeout_is_reused_until_enough_new_samples(self):
+        manager = TimeoutManager(TimeoutConfig(recompute_interval=4, min_timeout=0.1))
+        for _ in range(10):
+            manager.record_response_time("TestMethod", 1.0)
+        first = await manager.get_timeout("TestMethod")
+
+        for _ in range(3):
+            manager.record_response_time("TestMethod", 10.0)
+        assert await manager.get_timeout("TestMethod") == first
+
+        manager.record_response_time("TestMethod", 10.0)
+        assert await manager.get_timeout("TestMethod") > first
+
     async def test_returns_base_timeout_with_insufficient_history(self, timeout_manager):
         for _i in range(5):
-            await timeout_manager.record_response_time("TestMethod", 1.0)
+            timeout_manager.record_response_time("TestMethod", 1.0)
 
         timeout = await timeout_manager.get_timeout("TestMethod")
 
         assert timeout == timeout_manager.config.default_timeout
 
-    @pytest.mark.asyncio
     async def test_adaptive_timeout_disabled(self):
         config = TimeoutConfig(adaptive_enabled=False, default_timeout=10.0)
         manager = TimeoutManager(config)
 
         for _i in range(20):
-            await manager.record_response_time("TestMethod", 100.0)
+            manager.record_response_time("TestMethod", 100.0)
 
         timeout = await manager.get_timeout("TestMethod")
 
         assert timeout == 10.0
 
+    async def test_adaptive_disabled_uses_method_base_timeout(self):
+        manager = TimeoutManager(TimeoutConfig(adaptive_enabled=False))
+        method = "/ai_agent.ClaudeService/CreatePlan"
+
+        for _i in range(20):
+            manager.record_response_time(method, 0.01)
+
+        assert await manager.get_timeout(method) == 60.0
+
+        # 비활성 상태에서 캐시된 값이 없어야 활성화 직후 기록된 히스토리로 계산됨
+        manager.config.adaptive_enabled = True
+        assert await manager.get_timeout(method) == manager.config.min_timeout
+
 
 class TestTimeoutManagerPercentile:
-    @pytest.mark.asyncio
-    async def test_percentile_calculation(self, timeout_manager):
+    async def test_percentile_calculation(self, shared_timeout_manager):
         data = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0]
-        p95 = timeout_manager._get_percentile(data, 95.0)
+        p95 = shared_timeout_manager._get_percentile(data, 95.0)
 
         assert p95 == 10.0
 
-    @pytest.mark.asyncio
-    async def test_percentile_empty_data(self, timeout_manager):
-        p95 = timeout_manager._get_percentile([], 95.0)
+    async def test_percentile_empty_data(self, shared_timeout_manager):
+        p95 = shared_timeout_manager._get_percentile([], 95.0)
 
-        assert p95 == timeout_manager.config.default_timeout
+        assert p95 == shared_timeout_manager.config.default_timeout
 
 
 class TestTimeoutManagerMethodExtraction:
-    @pytest.mark.asyncio
-    async def test_extracts_method_from_path(self, timeout_manager):
-        method_name = timeout_manager._extract_method_name("/ai_agent.ClaudeService/CreatePlan")
+    async def test_extracts_method_from_path(self, shared_timeout_manager):
+        method_name = shared_timeout_manager._extract_method_name(
+            "/ai_agent.ClaudeService/CreatePlan"
+        )
 
         assert method_name == "CreatePlan"
 
-    @pytest.mark.asyncio
-    async def test_handles_simple_method_name(self, timeout_manager):
-        method_name = timeout_manager._extract_method_name("CreatePlan")
+    async def test_handles_simple_method_name(self, shared_timeout_manager):
+        method_name = shared_timeout_manager._extract_method_name("CreatePlan")
 
         assert method_name == "CreatePlan"
 
+    async def test_resolves_each_method_path_once(self, timeout_manager):
+        for _ in range(3):
+            await timeout_manager.get_timeout(b"/ai_agent.ClaudeService/CreatePlan")
+
+        info = timeout_manager._resolve.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
+        assert timeout_manager._resolve(b"/ai_agent.ClaudeService/CreatePlan") == "CreatePlan"
+
+    async def test_config_changes_apply_to_resolved_paths(self):
+        manager = TimeoutManager(TimeoutConfig())
+        method = "/ai_agent.ClaudeService/CreatePlan"
+        assert await manager.get_timeout(method) == 60.0
+
+        manager.config.method_timeouts["CreatePlan"] = 45.0
+        assert await manager.get_timeout(method) == 45.0
+
+        manager.config.default_timeout = 12.0
+        assert await manager.get_timeout("/ai_agent.ClaudeService/Unknown") == 12.0
+
 
 class TestTimeoutManagerMetrics:
-    @pytest.mark.asyncio
-    async def test_get_metrics_empty(self, timeout_manager):
-        metrics = timeout_manager.get_metrics()
+    async def test_get_metrics_empty(self, shared_timeout_manager):
+        metrics = shared_timeout_manager.get_metrics()
 
         assert metrics == {}
 
-    @pytest.mark.asyncio
     async def test_get_metrics_with_data(self, timeout_manager):
-        await timeout_manager.record_response_time("MethodA", 1.0)
-        await timeout_manager.record_response_time("MethodA", 2.0)
-        await timeout_manager.record_response_time("MethodA", 3.0)
+        timeout_manager.record_response_time("MethodA", 1.0)
+        timeout_manager.record_response_time("MethodA", 2.0)
+        timeout_manager.record_response_time("MethodA", 3.0)
 
         metrics = timeout_manager.get_metrics()
 
@@ -143,9 +224,21 @@ class TestTimeoutManagerMetrics:
         assert metrics["MethodA"]["min"] == 1.0
         assert metrics["MethodA"]["max"] == 3.0
 
+    def test_get_metrics_tracks_sliding_window(self, timeout_manager):
+        for i in range(30):
+            timeout_manager.record_response_time("MethodA", float(i))
+
+        metrics = timeout_manager.get_metrics()["MethodA"]
+        history = timeout_manager._response_times["MethodA"]
+
+        assert metrics["count"] == len(history)
+        assert metrics["avg"] == pytest.approx(sum(history) / len(history))
+        assert metrics["min"] == min(history)
+        assert metrics["max"] == max(history)
+        assert metrics["p95"] == timeout_manager._get_percentile(list(history), 95)
+
 
 class TestAdaptiveTimeoutInterceptor:
-    @pytest.mark.asyncio
     async def test_applies_timeout_to_call(
         self, timeout_manager, mock_call_details, mock_success_continuation
     ):
@@ -165,7 +258,21 @@ class TestAdaptiveTimeoutInterceptor:
 
         assert captured_details.timeout is not None
 
-    @pytest.mark.asyncio
+    async def test_reuses_call_details_when_timeout_unchanged(
+        self, timeout_manager, mock_call_details
+    ):
+        interceptor = AdaptiveTimeoutInterceptor(timeout_manager)
+        details = mock_call_details._replace(timeout=timeout_manager.config.default_timeout)
+        captured = []
+
+        async def capturing_continuation(d, request):
+            captured.append(d)
+            return {"status": "success"}
+
+        await interceptor.intercept_unary_unary(capturing_continuation, details, {})
+
+        assert captured[0] is details
+
     async def test_records_response_time_on_success(
         self, mock_call_details, mock_success_continuation
     ):
@@ -181,7 +288,6 @@ class TestAdaptiveTimeoutInterceptor:
         method = mock_call_details.method
         assert len(manager._response_times.get(method, [])) == 1
 
-    @pytest.mark.asyncio
     async def test_records_response_time_on_failure(
         self, mock_call_details, mock_failure_continuation
     ):
@@ -199,9 +305,21 @@ class TestAdaptiveTimeoutInterceptor:
         method = mock_call_details.method
         assert len(manager._response_times.get(method, [])) == 1
 
+    async def test_recorded_history_drives_later_timeouts(
+        self, mock_call_details, mock_success_continuation
+    ):
+        manager = TimeoutManager(TimeoutConfig(min_timeout=0.1))
+        interceptor = AdaptiveTimeoutInterceptor(manager)
+        details = mock_call_details._replace(method="/ai_agent.ClaudeService/CreatePlan")
+
+        for _ in range(10):
+            await interceptor.intercept_unary_unary(mock_success_continuation, details, {})
+
+        timeout = await manager.get_timeout(details.method)
+        assert timeout < manager.config.method_timeouts["CreatePlan"]
+
 
 class TestAdaptiveTimeoutBounds:
-    @pytest.mark.asyncio
     async def test_timeout_respects_min_bound(self):
         config = TimeoutConfig(
             min_timeout=10.0,
@@ -212,13 +330,12 @@ class TestAdaptiveTimeoutBounds:
         manager = TimeoutManager(config)
 
         for _i in range(15):
-            await manager.record_response_time("FastMethod", 0.1)
+            manager.record_response_time("FastMethod", 0.1)
 
         timeout = await manager.get_timeout("FastMethod")
 
         assert timeout >= config.min_timeout
 
-    @pytest.mark.asyncio
     async def test_timeout_respects_max_bound(self):
         config = TimeoutConfig(
             min_timeout=1.0,
@@ -229,7 +346,7 @@ class TestAdaptiveTimeoutBounds:
         manager = TimeoutManager(config)
 
         for _i in range(15):
-            await manager.record_response_time("SlowMethod", 100.0)
+            manager.record_response_time("SlowMethod", 100.0)
 
         timeout = await manager.get_timeout("SlowMethod")
 
@@ -1,12 +1,8 @@
 import asyncio
-import sys
-from pathlib import Path
 
 import pytest
 from grpc import StatusCode
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from services.interceptors.circuit_breaker import (
     CircuitBreaker,
     CircuitBreakerConfig,
@@ -15,89 +11,87 @@ from services.interceptors.circuit_breaker import (
     CircuitBreakerState,
 )
 
+_UNAVAILABLE = StatusCode.UNAVAILABLE
+
 
 class TestCircuitBreakerState:
-    @pytest.mark.asyncio
     async def test_initial_state_is_closed(self, circuit_breaker):
         assert circuit_breaker.state == CircuitBreakerState.CLOSED
 
-    @pytest.mark.asyncio
     async def test_can_execute_when_closed(self, circuit_breaker):
         assert await circuit_breaker.can_execute() is True
 
-    @pytest.mark.asyncio
     async def test_transitions_to_open_after_failures(self, circuit_breaker):
         for _ in range(3):
-            await circuit_breaker.record_failure(StatusCode.UNAVAILABLE)
+            await circuit_breaker.record_failure(_UNAVAILABLE)
 
         assert circuit_breaker.state == CircuitBreakerState.OPEN
 
-    @pytest.mark.asyncio
-    async def test_cannot_execute_when_open(self, circuit_breaker):
-        for _ in range(3):
-            await circuit_breaker.record_failure(StatusCode.UNAVAILABLE)
+    async def test_cannot_execute_when_open(self, opened_breaker):
+        assert await opened_breaker.can_execute() is False
 
-        assert await circuit_breaker.can_execute() is False
+    async def test_open_rejection_does_not_wait_for_state_lock(self, opened_breaker):
+        async with opened_breaker._state_lock:
+            allowed = await asyncio.wait_for(opened_breaker.can_execute(), 1.0)
 
-    @pytest.mark.asyncio
-    async def test_transitions_to_half_open_after_timeout(self, circuit_breaker):
-        for _ in range(3):
-            await circuit_breaker.record_failure(StatusCode.UNAVAILABLE)
+        assert allowed is False
 
-        assert circuit_breaker.state == CircuitBreakerState.OPEN
+    async def test_reset_remaining_counts_down_from_last_failure(self, circuit_breaker, fake_clock):
+        assert circuit_breaker.reset_remaining() == 0.0
 
-        await asyncio.sleep(1.1)
+        for _ in range(3):
+            await circuit_breaker.record_failure(_UNAVAILABLE)
 
-        assert circuit_breaker.state == CircuitBreakerState.HALF_OPEN
+        assert circuit_breaker.reset_remaining() == circuit_breaker.config.reset_timeout
 
-    @pytest.mark.asyncio
-    async def test_half_open_allows_limited_calls(self, circuit_breaker):
-        for _ in range(3):
-            await circuit_breaker.record_failure(StatusCode.UNAVAILABLE)
+        fake_clock.advance(0.4)
+        assert circuit_breaker.reset_remaining() == pytest.approx(0.6)
 
-        await asyncio.sleep(1.1)
+    async def test_transitions_to_half_open_after_timeout(self, opened_breaker, fake_clock):
+        assert opened_breaker.state == CircuitBreakerState.OPEN
 
-        assert await circuit_breaker.can_execute() is True
-        assert await circuit_breaker.can_execute() is True
-        assert await circuit_breaker.can_execute() is False
+        fake_clock.advance(1.1)
 
-    @pytest.mark.asyncio
-    async def test_transitions_to_closed_after_successes_in_half_open(self, circuit_breaker):
-        for _ in range(3):
-            await circuit_breaker.record_failure(StatusCode.UNAVAILABLE)
+        assert opened_breaker.state == CircuitBreakerState.HALF_OPEN
 
-        await asyncio.sleep(1.1)
+    async def test_half_open_allows_limited_calls(self, opened_breaker, fake_clock):
+        fake_clock.advance(1.1)
 
-        await circuit_breaker.can_execute()
-        await circuit_breaker.record_success()
-        await circuit_breaker.can_execute()
-        await circuit_breaker.record_success()
+        assert await opened_breaker.can_execute() is True
+        assert await opened_breaker.can_execute() is True
+        assert await opened_breaker.can_execute() is False
 
-        assert circuit_breaker.state == CircuitBreakerState.CLOSED
+    async def test_transitions_to_closed_after_successes_in_half_open(
+        self, opened_breaker, fake_clock
+    ):
+        fake_clock.advance(1.1)
 
-    @pytest.mark.asyncio
-    async def test_transitions_back_to_open_on_failure_in_half_open(self, circuit_breaker):
-        for _ in range(3):
-            await circuit_breaker.record_failure(StatusCode.UNAVAILABLE)
+        await opened_breaker.can_execute()
+        await opened_breaker.record_success()
+        await opened_breaker.can_execute()
+        await opened_breaker.record_success()
+
+        assert opened_breaker.state == CircuitBreakerState.CLOSED
 
-        await asyncio.sleep(1.1)
+    async def test_transitions_back_to_open_on_failure_in_half_open(
+        self, opened_breaker, fake_clock
+    ):
+        fake_clock.advance(1.1)
 
-        await circuit_breaker.can_execute()
-        await circuit_breaker.record_failure(StatusCode.UNAVAILABLE)
+        await opened_breaker.can_execute()
+        await opened_breaker.record_failure(_UNAVAILABLE)
 
-        assert circuit_breaker.state == CircuitBreakerState.OPEN
+        assert opened_breaker.state == CircuitBreakerState.OPEN
 
 
 class TestCircuitBreakerFailureCounting:
-    @pytest.mark.asyncio
     async def test_counts_configured_failure_codes(self, circuit_breaker):
-        await circuit_breaker.record_failure(StatusCode.UNAVAILABLE)
+        await circuit_breaker.record_failure(_UNAVAILABLE)
         assert circuit_breaker._failure_count == 1
 
         await circuit_breaker.record_failure(StatusCode.DEADLINE_EXCEEDED)
         assert circuit_breaker._failure_count == 2
 
-    @pytest.mark.asyncio
     async def test_ignores_non_failure_codes(self, circuit_breaker):
         await circuit_breaker.record_failure(StatusCode.NOT_FOUND)
         assert circuit_breaker._failure_count == 0
@@ -105,16 +99,14 @@ class TestCircuitBreakerFailureCounting:
         await circuit_breaker.record_failure(StatusCode.INVALID_ARGUMENT)
         assert circuit_breaker._failure_count == 0
 
-    @pytest.mark.asyncio
     async def test_success_decrements_failure_count(self, circuit_breaker):
-        await circuit_breaker.record_failure(StatusCode.UNAVAILABLE)
-        await circuit_breaker.record_failure(StatusCode.UNAVAILABLE)
+        await circuit_breaker.record_failure(_UNAVAILABLE)
+        await circuit_breaker.record_failure(_UNAVAILABLE)
         assert circuit_breaker._failure_count == 2
 
         await circuit_breaker.record_success()
         assert circuit_breaker._failure_count == 1
 
-    @pytest.mark.asyncio
     async def test_failure_count_does_not_go_negative(self, circuit_breaker):
         await circuit_breaker.record_success()
         await circuit_breaker.record_success()
@@ -123,51 +115,58 @@ class TestCircuitBreakerFailureCounting:
 
 
 class TestCircuitBreakerMetrics:
-    @pytest.mark.asyncio
     async def test_tracks_total_calls(self, circuit_breaker):
         await circuit_breaker.record_success()
-        await circuit_breaker.record_failure(StatusCode.UNAVAILABLE)
+        await circuit_breaker.record_failure(_UNAVAILABLE)
         await circuit_breaker.record_success()
 
         metrics = circuit_breaker.get_metrics()
         assert metrics["total_calls"] == 3
 
-    @pytest.mark.asyncio
     async def test_tracks_successes_and_failures(self, circuit_breaker):
         await circuit_breaker.record_success()
         await circuit_breaker.record_success()
-        await circuit_breaker.record_failure(StatusCode.UNAVAILABLE)
+        await circuit_breaker.record_failure(_UNAVAILABLE)
 
         metrics = circuit_breaker.get_metrics()
         assert metrics["total_successes"] == 2
         assert metrics["total_failures"] == 1
 
-    @pytest.mark.asyncio
-    async def test_tracks_state_changes(self, circuit_breaker):
-        for _ in range(3):
-            await circuit_breaker.record_failure(StatusCode.UNAVAILABLE)
-
-        metrics = circuit_breaker.get_metrics()
+    async def test_tracks_state_changes(self, opened_breaker):
+        metrics = opened_breaker.get_metrics()
         assert metrics["state_changes"] == 1
         assert metrics["state"] == "open"
 
+    async def test_state_change_history_is_bounded(self, circuit_breaker):
+        from services.interceptors.circuit_breaker import STATE_HISTORY_SIZE
+
+        for _ in range(STATE_HISTORY_SIZE):
+            await circuit_breaker.reset()
+
+        await circuit_breaker.reset()
+
+        assert circuit_breaker.get_metrics()["state_changes"] == STATE_HISTORY_SIZE + 1
+        assert len(circuit_breaker._state_changes) == STATE_HISTORY_SIZE
+
 
 class TestCircuitBreakerReset:
-    @pytest.mark.asyncio
-    async def test_manual_reset_returns_to_closed(self, circuit_breaker):
-        for _ in range(3):
-            await circuit_breaker.record_failure(StatusCode.UNAVAILABLE)
+    async def test_manual_reset_returns_to_closed(self, opened_breaker):
+        assert opened_breaker.state == CircuitBreakerState.OPEN
 
-        assert circuit_breaker.state == CircuitBreakerState.OPEN
+        await opened_breaker.reset()
 
-        await circuit_breaker.reset()
+        assert opened_breaker.state == CircuitBreakerState.CLOSED
+        assert opened_breaker._failure_count == 0
 
-        assert circuit_breaker.state == CircuitBreakerState.CLOSED
-        assert circuit_breaker._failure_count == 0
+    async def test_can_execute_after_reset(self, opened_breaker):
+        assert await opened_breaker.can_execute() is False
+
+        await opened_breaker.reset()
+
+        assert await opened_breaker.can_execute() is True
 
 
 class TestCircuitBreakerInterceptor:
-    @pytest.mark.asyncio
     async def test_allows_call_when_closed(
         self, circuit_breaker, mock_call_details, mock_success_continuation
     ):
@@ -181,14 +180,10 @@ class TestCircuitBreakerInterceptor:
 
         assert result["status"] == "success"
 
-    @pytest.mark.asyncio
     async def test_blocks_call_when_open(
-        self, circuit_breaker, mock_call_details, mock_success_continuation
+        self, opened_breaker, mock_call_details, mock_success_continuation
     ):
-        for _ in range(3):
-            await circuit_breaker.record_failure(StatusCode.UNAVAILABLE)
-
-        interceptor = CircuitBreakerInterceptor(circuit_breaker)
+        interceptor = CircuitBreakerInterceptor(opened_breaker)
 
         with pytest.raises(CircuitBreakerOpenError):
             await interceptor.intercept_unary_unary(
@@ -197,17 +192,13 @@ class TestCircuitBreakerInterceptor:
                 {},
             )
 
-    @pytest.mark.asyncio
     async def test_uses_fallback_when_open(
-        self, circuit_breaker, mock_call_details, mock_success_continuation
+        self, opened_breaker, mock_call_details, mock_success_continuation
     ):
-        for _ in range(3):
-            await circuit_breaker.record_failure(StatusCode.UNAVAILABLE)
-
         async def fallback(request):
             return {"status": "fallback"}
 
-        interceptor = CircuitBreakerInterceptor(circuit_breaker, fallback=fallback)
+        interceptor = CircuitBreakerInterceptor(opened_breaker, fallback=fallback)
 
         result = await interceptor.intercept_unary_unary(
             mock_success_continuation,
@@ -217,7 +208,6 @@ class TestCircuitBreakerInterceptor:
 
         assert result["status"] == "fallback"
 
-    @pytest.mark.asyncio
     async def test_records_success_on_successful_call(
         self, circuit_breaker, mock_call_details, mock_success_continuation
     ):
@@ -231,12 +221,11 @@ class TestCircuitBreakerInterceptor:
 
         assert circuit_breaker._total_successes == 1
 
-    @pytest.mark.asyncio
     async def test_records_failure_on_grpc_error(
         self, circuit_breaker, mock_call_details, mock_failure_continuation
     ):
         interceptor = CircuitBreakerInterceptor(circuit_breaker)
-        continuation = mock_failure_continuation(StatusCode.UNAVAILABLE)
+        continuation = mock_failure_continuation(_UNAVAILABLE)
 
         with pytest.raises(Exception):
             await interceptor.intercept_unary_unary(
@@ -249,29 +238,27 @@ class TestCircuitBreakerInterceptor:
 
 
 class TestCircuitBreakerConfiguration:
-    @pytest.mark.asyncio
     async def test_custom_failure_threshold(self):
         config = CircuitBreakerConfig(failure_threshold=5)
         cb = CircuitBreaker("test", config)
 
         for _i in range(4):
-            await cb.record_failure(StatusCode.UNAVAILABLE)
+            await cb.record_failure(_UNAVAILABLE)
             assert cb.state == CircuitBreakerState.CLOSED
 
-        await cb.record_failure(StatusCode.UNAVAILABLE)
+        await cb.record_failure(_UNAVAILABLE)
         assert cb.state == CircuitBreakerState.OPEN
 
-    @pytest.mark.asyncio
-    async def test_custom_success_threshold(self):
+    async def test_custom_success_threshold(self, fake_clock):
         config = CircuitBreakerConfig(
             failure_threshold=1,
             success_threshold=3,
             reset_timeout=0.1,
         )
-        cb = CircuitBreaker("test", config)
+        cb = CircuitBreaker("test", config, time_fn=fake_clock.now)
 
-        await cb.record_failure(StatusCode.UNAVAILABLE)
-        await asyncio.sleep(0.15)
+        await cb.record_failure(_UNAVAILABLE)
+        fake_clock.advance(0.15)
 
         await cb.can_execute()
         await cb.record_success()
@@ -0,0 +1,25 @@
+from datetime import datetime
+
+from services import clock
+
+
+class TestNowIso:
+    def test_uses_millisecond_precision(self, monkeypatch):
+        monkeypatch.setattr(clock.time, "time", lambda: 1_700_000_000.123456)
+
+        value = clock.now_iso()
+
+        assert value == datetime.fromtimestamp(1_700_000_000.123).isoformat(timespec="milliseconds")
+        assert value.endswith(".123")
+
+    def test_reuses_string_within_same_millisecond(self, monkeypatch):
+        now = [1_700_000_000.5001]
+        monkeypatch.setattr(clock.time, "time", lambda: now[0])
+
+        first = clock.now_iso()
+        now[0] = 1_700_000_000.5009
+        assert clock.now_iso() is first
+
+        now[0] = 1_700_000_000.5012
+        assert clock.now_iso() != first
+        assert clock.now_iso().endswith(".501")
@@ -0,0 +1,27 @@
+import asyncio
+import time
+
+from services.codex_service import CodexService
+
+
+class TestCodexRunCommand:
+    async def test_returns_output_and_exit_code(self):
+        service = CodexService()
+
+        result = await service._run_command("echo out; echo err >&2; exit 3", "/tmp", 5, {})
+
+        assert result["exit_code"] == 3
+        assert result["stdout"] == "out\n"
+        assert result["stderr"] == "err\n"
+
+    def test_timeout_covers_process_that_closes_pipes_early(self):
+        # uvloop 은 프로세스 종료 전까지 파이프 EOF 를 늦게 전달하므로 기본 asyncio 루프에서 재현
+        service = CodexService()
+
+        start = time.perf_counter()
+        result = asyncio.run(service._run_command("exec >/dev/null 2>&1; sleep 5", "/tmp", 1, {}))
+        elapsed = time.perf_counter() - start
+
+        assert result["exit_code"] == -1
+        assert "timed out" in result["stderr"]
+        assert elapsed < 3
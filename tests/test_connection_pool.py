@@ -1,11 +1,7 @@
-import sys
-from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from gateway.connection_pool import (
     ConnectionPool,
     MultiServicePool,
@@ -42,7 +38,6 @@ class TestPooledConnection:
 
 
 class TestConnectionPool:
-    @pytest.mark.asyncio
     async def test_initialize_creates_min_connections(
         self, pool_config, mock_connection_factory, mock_health_checker
     ):
@@ -60,7 +55,6 @@ class TestConnectionPool:
         finally:
             await pool.close()
 
-    @pytest.mark.asyncio
     async def test_acquire_returns_connection(
         self, pool_config, mock_connection_factory, mock_health_checker
     ):
@@ -80,7 +74,6 @@ class TestConnectionPool:
         finally:
             await pool.close()
 
-    @pytest.mark.asyncio
     async def test_acquire_marks_connection_used(
         self, pool_config, mock_connection_factory, mock_health_checker
     ):
@@ -101,7 +94,6 @@ class TestConnectionPool:
         finally:
             await pool.close()
 
-    @pytest.mark.asyncio
     async def test_release_returns_connection_to_pool(
         self, pool_config, mock_connection_factory, mock_health_checker
     ):
@@ -123,7 +115,6 @@ class TestConnectionPool:
         finally:
             await pool.close()
 
-    @pytest.mark.asyncio
     async def test_creates_new_connection_when_exhausted(self, mock_connection_factory):
         config = PoolConfig(min_size=1, max_size=3, acquire_timeout=0.1)
         pool = ConnectionPool("test", mock_connection_factory, config)
@@ -140,7 +131,6 @@ class TestConnectionPool:
         finally:
             await pool.close()
 
-    @pytest.mark.asyncio
     async def test_raises_when_max_size_reached(self, mock_connection_factory):
         config = PoolConfig(min_size=1, max_size=1, acquire_timeout=0.1)
         pool = ConnectionPool("test", mock_connection_factory, config)
@@ -155,7 +145,6 @@ class TestConnectionPool:
         finally:
             await pool.close()
 
-    @pytest.mark.asyncio
     async def test_close_destroys_all_connections(
         self, pool_config, mock_connection_factory, mock_health_checker
     ):
@@ -172,7 +161,6 @@ class TestConnectionPool:
         assert pool._closed is True
         assert len(pool._all_connections) == 0
 
-    @pytest.mark.asyncio
     async def test_acquire_on_closed_pool_raises(
         self, pool_config, mock_connection_factory, mock_health_checker
     ):
@@ -190,7 +178,6 @@ class TestConnectionPool:
             async with pool.acquire():
                 pass
 
-    @pytest.mark.asyncio
     async def test_get_stats(self, pool_config, mock_connection_factory, mock_health_checker):
         pool = ConnectionPool(
             "test",
@@ -213,7 +200,6 @@ class TestConnectionPool:
 
 
 class TestConnectionPoolHealthCheck:
-    @pytest.mark.asyncio
     async def test_unhealthy_connection_is_replaced(self, mock_connection_factory):
         health_results = [True, True, False]
         call_count = 0
@@ -242,7 +228,6 @@ class TestConnectionPoolHealthCheck:
 
 
 class TestMultiServicePool:
-    @pytest.mark.asyncio
     async def test_add_and_get_pool(
         self, pool_config, mock_connection_factory, mock_health_checker
     ):
@@ -260,7 +245,6 @@ class TestMultiServicePool:
 
         assert retrieved is pool
 
-    @pytest.mark.asyncio
     async def test_get_nonexistent_pool_returns_none(self):
         multi_pool = MultiServicePool()
 
@@ -268,7 +252,6 @@ class TestMultiServicePool:
 
         assert retrieved is None
 
-    @pytest.mark.asyncio
     async def test_initialize_all(self, pool_config, mock_connection_factory, mock_health_checker):
         multi_pool = MultiServicePool()
 
@@ -286,7 +269,6 @@ class TestMultiServicePool:
         finally:
             await multi_pool.close_all()
 
-    @pytest.mark.asyncio
     async def test_close_all(self, pool_config, mock_connection_factory, mock_health_checker):
         multi_pool = MultiServicePool()
 
@@ -302,7 +284,6 @@ class TestMultiServicePool:
         assert pool1._closed is True
         assert pool2._closed is True
 
-    @pytest.mark.asyncio
     async def test_get_all_stats(self, pool_config, mock_connection_factory, mock_health_checker):
         multi_pool = MultiServicePool()
 
@@ -1,12 +1,9 @@
 import asyncio
-import sys
-from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
+from services import fallback as fallback_module
 from services.fallback import (
     CacheEntry,
     ClaudeFallbackHandler,
@@ -23,20 +20,19 @@ class TestCacheEntry:
     def test_is_not_expired_within_ttl(self):
         import time
 
-        entry = CacheEntry(value="test", timestamp=time.time(), ttl=60.0)
+        entry = CacheEntry(value="test", expires_at=time.monotonic() + 60.0)
 
         assert entry.is_expired is False
 
     def test_is_expired_after_ttl(self):
         import time
 
-        entry = CacheEntry(value="test", timestamp=time.time() - 100, ttl=60.0)
+        entry = CacheEntry(value="test", expires_at=time.monotonic() - 40.0)
 
         assert entry.is_expired is True
 
 
 class TestFallbackCache:
-    @pytest.mark.asyncio
     async def test_set_and_get(self, fallback_cache):
         await fallback_cache.set("method", {"key": "value"}, "response")
 
@@ -44,13 +40,11 @@ class TestFallbackCache:
 
         assert result == "response"
 
-    @pytest.mark.asyncio
     async def test_returns_none_for_missing_entry(self, fallback_cache):
         result = await fallback_cache.get("missing", {})
 
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_returns_none_for_expired_entry(self):
         config = FallbackConfig(cache_ttl=0.01)
         cache = FallbackCache(config)
@@ -62,7 +56,6 @@ class TestFallbackCache:
 
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_evicts_oldest_when_full(self):
         config = FallbackConfig(max_cache_size=2)
         cache = FallbackCache(config)
@@ -79,7 +72,6 @@ class TestFallbackCache:
         assert result1 is None
         assert result3 == "response3"
 
-    @pytest.mark.asyncio
     async def test_clear_removes_all_entries(self, fallback_cache):
         await fallback_cache.set("method1", {}, "response1")
         await fallback_cache.set("method2", {}, "response2")
@@ -92,7 +84,6 @@ class TestFallbackCache:
         assert result1 is None
         assert result2 is None
 
-    @pytest.mark.asyncio
     async def test_get_stats(self, fallback_cache):
         await fallback_cache.set("method", {}, "response")
 
@@ -101,7 +92,6 @@ class TestFallbackCache:
         assert stats["size"] == 1
         assert stats["max_size"] == fallback_cache.config.max_cache_size
 
-    @pytest.mark.asyncio
     async def test_disabled_cache_does_not_store(self):
         config = FallbackConfig(cache_enabled=False)
         cache = FallbackCache(config)
@@ -111,9 +101,24 @@ class TestFallbackCache:
 
         assert result is None
 
+    def test_make_key_is_stable_for_equal_requests(self, fallback_cache):
+        from services.grpc_generated import ai_agent_pb2
+
+        plan_a = ai_agent_pb2.PlanRequest(task_description="Build API")
+        plan_b = ai_agent_pb2.PlanRequest(task_description="Build API")
+        plan_c = ai_agent_pb2.PlanRequest(task_description="Build CLI")
+
+        assert fallback_cache._make_key("m", plan_a) == fallback_cache._make_key("m", plan_b)
+        assert fallback_cache._make_key("m", plan_a) != fallback_cache._make_key("m", plan_c)
+        assert fallback_cache._make_key("m", {"k": 1}) == fallback_cache._make_key("m", {"k": 1})
+
+    def test_make_key_handles_unpicklable_request(self, fallback_cache):
+        key = fallback_cache._make_key("method", MagicMock())
+
+        assert key.startswith("method:")
+
 
 class TestRuleBasedFallback:
-    @pytest.mark.asyncio
     async def test_register_and_use_rule(self):
         handler = RuleBasedFallback()
         handler.register_rule("Test", lambda req: {"fallback": True})
@@ -122,7 +127,6 @@ class TestRuleBasedFallback:
 
         assert result == {"fallback": True}
 
-    @pytest.mark.asyncio
     async def test_returns_none_for_no_matching_rule(self):
         handler = RuleBasedFallback()
 
@@ -130,7 +134,6 @@ class TestRuleBasedFallback:
 
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_extracts_method_from_path(self):
         handler = RuleBasedFallback()
         handler.register_rule("Plan", lambda req: {"fallback": True})
@@ -139,7 +142,6 @@ class TestRuleBasedFallback:
 
         assert result == {"fallback": True}
 
-    @pytest.mark.asyncio
     async def test_async_rule_handler(self):
         handler = RuleBasedFallback()
 
@@ -152,7 +154,6 @@ class TestRuleBasedFallback:
 
         assert result == {"async_fallback": True}
 
-    @pytest.mark.asyncio
     async def test_handles_rule_exception(self):
         handler = RuleBasedFallback()
 
@@ -165,9 +166,63 @@ class TestRuleBasedFallback:
 
         assert result is None
 
+    async def test_first_registered_matching_rule_wins(self):
+        handler = RuleBasedFallback()
+        handler.register_rule("Plan", lambda req: {"rule": "plan"})
+        handler.register_rule("Create", lambda req: {"rule": "create"})
+        handler.register_rule("Code", lambda req: {"rule": "code"})
+
+        assert await handler.handle("/service/CreatePlan", {}) == {"rule": "plan"}
+        assert await handler.handle("/service/GenerateCode", {}) == {"rule": "code"}
+
+    async def test_rule_registered_after_first_use(self):
+        handler = RuleBasedFallback()
+        handler.register_rule("Plan", lambda req: {"rule": "plan"})
+        await handler.handle("CreatePlan", {})
+
+        handler.register_rule("Analyze", lambda req: {"rule": "analyze"})
+
+        assert await handler.handle("Analyze", {}) == {"rule": "analyze"}
+
+
+@pytest.fixture(params=["automaton", "linear"])
+def rule_handler(request, monkeypatch):
+    """RuleBasedFallback with and without the Aho-Corasick automaton."""
+    if request.param == "linear":
+        monkeypatch.setattr(fallback_module, "ahocorasick", None)
+    return RuleBasedFallback()
+
+
+class TestRuleBasedFallbackMatchOrder:
+    async def test_first_registered_match_wins(self, rule_handler):
+        rule_handler.register_rule("Plan", lambda req: {"rule": "plan"})
+        rule_handler.register_rule("Create", lambda req: {"rule": "create"})
+
+        assert await rule_handler.handle("/service/CreatePlan", {}) == {"rule": "plan"}
+        assert await rule_handler.handle("/service/CreateCode", {}) == {"rule": "create"}
+        assert await rule_handler.handle("/service/Analyze", {}) is None
+
+    async def test_failing_rule_falls_through_to_next_match(self, rule_handler):
+        def failing(req):
+            raise ValueError("Rule failed")
+
+        rule_handler.register_rule("Plan", failing)
+        rule_handler.register_rule("Other", lambda req: {"rule": "other"})
+        rule_handler.register_rule("Create", lambda req: {"rule": "create"})
+
+        assert await rule_handler.handle("CreatePlan", {}) == {"rule": "create"}
+
+    async def test_re_registered_pattern_keeps_its_position(self, rule_handler):
+        rule_handler.register_rule("Plan", lambda req: {"rule": "old"})
+        rule_handler.register_rule("Create", lambda req: {"rule": "create"})
+        await rule_handler.handle("CreatePlan", {})
+
+        rule_handler.register_rule("Plan", lambda req: {"rule": "new"})
+
+        assert await rule_handler.handle("CreatePlan", {}) == {"rule": "new"}
+
 
 class TestClaudeFallbackHandler:
-    @pytest.mark.asyncio
     async def test_health_check_fallback(self):
         handler = ClaudeFallbackHandler()
 
@@ -176,7 +231,6 @@ class TestClaudeFallbackHandler:
         assert result["status"] == "DEGRADED"
         assert result["version"] == "fallback"
 
-    @pytest.mark.asyncio
     async def test_create_plan_fallback(self):
         handler = ClaudeFallbackHandler()
         request = MagicMock()
@@ -188,7 +242,6 @@ class TestClaudeFallbackHandler:
         assert len(result["steps"]) == 1
         assert result["steps"][0]["phase"] == "Fallback"
 
-    @pytest.mark.asyncio
     async def test_unknown_method_returns_none(self):
         handler = ClaudeFallbackHandler()
 
@@ -198,7 +251,6 @@ class TestClaudeFallbackHandler:
 
 
 class TestGeminiFallbackHandler:
-    @pytest.mark.asyncio
     async def test_health_check_fallback(self):
         handler = GeminiFallbackHandler()
 
@@ -206,7 +258,6 @@ class TestGeminiFallbackHandler:
 
         assert result["status"] == "DEGRADED"
 
-    @pytest.mark.asyncio
     async def test_analyze_fallback(self):
         handler = GeminiFallbackHandler()
         request = MagicMock()
@@ -220,7 +271,6 @@ class TestGeminiFallbackHandler:
 
 
 class TestCodexFallbackHandler:
-    @pytest.mark.asyncio
     async def test_health_check_fallback(self):
         handler = CodexFallbackHandler()
 
@@ -228,7 +278,6 @@ class TestCodexFallbackHandler:
 
         assert result["status"] == "DEGRADED"
 
-    @pytest.mark.asyncio
     async def test_execute_fallback(self):
         handler = CodexFallbackHandler()
         request = MagicMock()
@@ -242,7 +291,6 @@ class TestCodexFallbackHandler:
 
 
 class TestFallbackManager:
-    @pytest.mark.asyncio
     async def test_get_fallback_from_cache(self, fallback_manager):
         await fallback_manager.cache_response("method", {}, "cached_response")
 
@@ -250,7 +298,6 @@ class TestFallbackManager:
 
         assert result == "cached_response"
 
-    @pytest.mark.asyncio
     async def test_get_fallback_from_custom_handler(self, fallback_manager):
         class CustomHandler:
             async def handle(self, method, request):
@@ -262,7 +309,6 @@ class TestFallbackManager:
 
         assert result == {"custom": True}
 
-    @pytest.mark.asyncio
     async def test_get_fallback_from_rule(self, fallback_manager):
         fallback_manager.register_rule("Test", lambda req: {"rule": True})
 
@@ -270,13 +316,11 @@ class TestFallbackManager:
 
         assert result == {"rule": True}
 
-    @pytest.mark.asyncio
     async def test_returns_none_when_no_fallback(self, fallback_manager):
         result = await fallback_manager.get_fallback("unknown", "unknown", {})
 
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_cache_takes_priority(self, fallback_manager):
         fallback_manager.register_rule("Method", lambda req: {"rule": True})
         await fallback_manager.cache_response("Method", {}, "cached")
@@ -287,7 +331,6 @@ class TestFallbackManager:
 
 
 class TestDefaultFallbackManager:
-    @pytest.mark.asyncio
     async def test_creates_manager_with_service_handlers(self):
         manager = create_default_fallback_manager()
 
@@ -295,7 +338,6 @@ class TestDefaultFallbackManager:
         assert "gemini" in manager._custom_handlers
         assert "codex" in manager._custom_handlers
 
-    @pytest.mark.asyncio
     async def test_claude_handler_works(self):
         manager = create_default_fallback_manager()
 
@@ -303,7 +345,6 @@ class TestDefaultFallbackManager:
 
         assert result["status"] == "DEGRADED"
 
-    @pytest.mark.asyncio
     async def test_gemini_handler_works(self):
         manager = create_default_fallback_manager()
 
@@ -311,7 +352,6 @@ class TestDefaultFallbackManager:
 
         assert result["status"] == "DEGRADED"
 
-    @pytest.mark.asyncio
     async def test_codex_handler_works(self):
         manager = create_default_fallback_manager()
 
@@ -0,0 +1,76 @@
+import pytest
+
+from services import gemini_service
+from services.gemini_service import GeminiService
+from services.protocol import JsonRpcResponse, MessageFramer
+
+
+class TestGeminiHandlers:
+    async def test_process_returns_dict(self):
+        result = await GeminiService().process({"task": "t", "content": "abc"})
+
+        assert isinstance(result, dict)
+        assert result["output"] == "[Gemini] Analyzed: t"
+        assert result["content_size"] == 3
+
+    async def test_analyze_returns_dict(self):
+        result = await GeminiService()._handle_analyze({"content": "x" * 8, "type": "code"})
+
+        assert isinstance(result, dict)
+        assert result["token_estimate"] == 2
+        assert len(result["findings"]) == 3
+
+    async def test_review_score_is_float(self):
+        service = GeminiService()
+
+        clean = await service._handle_review_code({"code": ""})
+        flagged = await service._handle_review_code({"code": "x = 1  # TODO"})
+
+        assert clean["overall_score"] == 100.0
+        assert flagged["overall_score"] == 95.0
+        assert isinstance(flagged["overall_score"], float)
+
+    async def test_shared_findings_are_read_only(self):
+        service = GeminiService()
+
+        review = await service._handle_review_code({"code": "x = 1  # TODO"})
+        with pytest.raises(TypeError):
+            review["issues"][0]["severity"] = "critical"
+
+        again = await service._handle_review_code({"code": "x = 1  # TODO"})
+        assert again["issues"][0]["severity"] == "low"
+
+    async def test_read_only_findings_encode_as_json(self):
+        result = await GeminiService()._handle_analyze({"content": "x", "type": "code"})
+
+        payload = MessageFramer.decode_payload(JsonRpcResponse.success("1", result).to_bytes())
+
+        assert payload["result"]["findings"][0]["category"] == "structure"
+
+    async def test_analyze_large_content_inline(self):
+        content = "x" * 500_000
+
+        result = await GeminiService()._handle_analyze({"content": content, "type": "code"})
+
+        assert result["content_length"] == 500_000
+        assert result["token_estimate"] == 125_000
+        assert [f["category"] for f in result["findings"]] == [
+            "structure",
+            "patterns",
+            "complexity",
+        ]
+
+    async def test_research_accepts_non_string_query(self):
+        result = await GeminiService()._handle_research({"query": ["a", "b"]})
+
+        assert result["results"][0]["topic"] == ["a", "b"]
+
+    async def test_research_caches_only_short_queries(self):
+        gemini_service._cached_research_results.cache_clear()
+        service = GeminiService()
+
+        await service._handle_research({"query": "short"})
+        await service._handle_research({"query": "q" * 10_000})
+
+        info = gemini_service._cached_research_results.cache_info()
+        assert info.currsize == 1
@@ -0,0 +1,157 @@
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from services.grpc_base_service import (
+    COMPRESSION_THRESHOLD,
+    CodexGrpcService,
+    CodexGrpcServicer,
+    GeminiGrpcService,
+    GeminiGrpcServicer,
+)
+from services.grpc_generated import ai_agent_pb2
+
+
+def test_import_leaves_logging_flags_untouched():
+    code = (
+        "import logging, services.grpc_base_service; "
+        "print(logging.logThreads, logging.logProcesses, logging.logMultiprocessing)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(__file__).parent.parent,
+    )
+
+    assert result.stdout.split() == ["True", "True", "True"]
+
+
+class FakeContext:
+    """Minimal grpc.aio.ServicerContext stand-in for calling servicers directly."""
+
+    def __init__(self):
+        self.compression = None
+        self._cancelled = False
+
+    def set_compression(self, compression):
+        self.compression = compression
+
+    def cancelled(self):
+        return self._cancelled
+
+
+class TestGeminiAnalyze:
+    async def test_large_request_small_response_is_not_compressed(self):
+        servicer = GeminiGrpcServicer(GeminiGrpcService())
+        context = FakeContext()
+
+        response = await servicer.Analyze(
+            ai_agent_pb2.AnalyzeRequest(content="x" * 100_000, analysis_type="code"), context
+        )
+
+        assert response.content_length == 100_000
+        assert response.ByteSize() <= COMPRESSION_THRESHOLD
+        assert context.compression is None
+
+
+def execute_request(command: str, timeout: int = 0) -> ai_agent_pb2.ExecuteRequest:
+    return ai_agent_pb2.ExecuteRequest(command=command, timeout_seconds=timeout)
+
+
+class TestCodexCommandParsing:
+    def test_parses_allowed_command_into_argv(self):
+        servicer = CodexGrpcServicer(CodexGrpcService())
+
+        assert servicer._parse_command("echo 'hello world'") == ["echo", "hello world"]
+        assert servicer._parse_command("/bin/echo hi") == ["/bin/echo", "hi"]
+
+    def test_rejects_disallowed_empty_and_unparsable_commands(self):
+        servicer = CodexGrpcServicer(CodexGrpcService())
+
+        assert servicer._parse_command("rm -rf /tmp/x") is None
+        assert servicer._parse_command("") is None
+        assert servicer._parse_command("   ") is None
+        assert servicer._parse_command('echo "unterminated') is None
+
+
+class TestCodexExecute:
+    async def test_returns_output_and_exit_code(self):
+        servicer = CodexGrpcServicer(CodexGrpcService())
+
+        ok = await servicer.Execute(execute_request("echo 'hello world'"), FakeContext())
+        failed = await servicer.Execute(
+            execute_request('python -c "import sys; sys.exit(3)"'), FakeContext()
+        )
+
+        assert ok.success and ok.exit_code == 0 and ok.stdout == "hello world\n"
+        assert not failed.success and failed.exit_code == 3
+
+    async def test_shell_metacharacters_are_passed_literally(self):
+        servicer = CodexGrpcServicer(CodexGrpcService())
+
+        response = await servicer.Execute(
+            execute_request("echo $HOME; rm -rf /tmp/x && ls | wc > out"), FakeContext()
+        )
+
+        assert response.stdout == "$HOME; rm -rf /tmp/x && ls | wc > out\n"
+
+    async def test_disallowed_command_is_not_run(self):
+        servicer = CodexGrpcServicer(CodexGrpcService())
+
+        response = await servicer.Execute(execute_request("rm -rf /tmp/x"), FakeContext())
+
+        assert not response.success
+        assert response.stderr == "Command not allowed"
+
+    async def test_timeout_kills_process(self):
+        servicer = CodexGrpcServicer(CodexGrpcService())
+
+        start = time.perf_counter()
+        response = await servicer.Execute(
+            execute_request('python -c "import time; time.sleep(5)"', timeout=1), FakeContext()
+        )
+
+        assert response.stderr == "Command timed out"
+        assert time.perf_counter() - start < 3
+
+
+class TestCodexStreamExecute:
+    async def stream(self, command: str, timeout: int = 0):
+        servicer = CodexGrpcServicer(CodexGrpcService())
+        return [
+            m
+            async for m in servicer.StreamExecute(execute_request(command, timeout), FakeContext())
+        ]
+
+    async def test_streams_output_lines_and_exit_code(self):
+        messages = await self.stream(
+            'python -u -c "import sys; print(1); print(2, file=sys.stderr); sys.exit(4)"'
+        )
+
+        assert messages[0].type == "log" and messages[0].content.startswith("Starting: ")
+        assert [m.content for m in messages[1:-1]] == ["1", "2"]
+        assert (messages[-1].type, messages[-1].content) == ("result", "Exit code: 4")
+        assert len({m.stream_id for m in messages}) == 1
+
+    async def test_timeout_kills_process(self):
+        start = time.perf_counter()
+        messages = await self.stream('python -c "import time; time.sleep(5)"', timeout=1)
+
+        assert (messages[-1].type, messages[-1].content) == ("error", "Command timed out")
+        assert time.perf_counter() - start < 3
+
+    async def test_disallowed_and_unparsable_commands_are_rejected(self):
+        for command in ("rm -rf /tmp/x", 'echo "unterminated'):
+            messages = await self.stream(command)
+
+            assert (messages[-1].type, messages[-1].content) == ("error", "Command not allowed")
+            assert len(messages) == 2
+
+    async def test_shell_metacharacters_are_passed_literally(self):
+        messages = await self.stream("echo a; echo b | wc")
+
+        assert [m.content for m in messages[1:-1]] == ["a; echo b | wc"]
+        assert messages[-1].content == "Exit code: 0"
@@ -5,14 +5,10 @@ Phase 1 통합 테스트
 """
 
 import asyncio
-import sys
-from pathlib import Path
 
 import pytest
 
 # 경로 설정
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from clients.tcp_client import (
     ClaudeClient,
     CodexClient,
@@ -33,7 +29,6 @@ def event_loop():
 class TestClaudeService:
     """Claude 서비스 테스트"""
 
-    @pytest.mark.asyncio
     async def test_health_check(self):
         """헬스 체크 테스트"""
         client = ClaudeClient()
@@ -44,7 +39,6 @@ class TestClaudeService:
             assert result["service"] == "claude"
             assert "uptime_seconds" in result
 
-    @pytest.mark.asyncio
     async def test_ping(self):
         """핑 테스트"""
         client = ClaudeClient()
@@ -54,7 +48,6 @@ class TestClaudeService:
             assert result["pong"] is True
             assert "timestamp" in result
 
-    @pytest.mark.asyncio
     async def test_info(self):
         """서비스 정보 테스트"""
         client = ClaudeClient()
@@ -65,7 +58,6 @@ class TestClaudeService:
             assert "methods" in result
             assert "health" in result["methods"]
 
-    @pytest.mark.asyncio
     async def test_process(self):
         """범용 처리 테스트"""
         client = ClaudeClient()
@@ -75,7 +67,6 @@ class TestClaudeService:
             assert "output" in result
             assert result["agent"] == "claude"
 
-    @pytest.mark.asyncio
     async def test_plan(self):
         """계획 수립 테스트"""
         client = ClaudeClient()
@@ -88,7 +79,6 @@ class TestClaudeService:
             assert len(result["steps"]) > 0
             assert "total_steps" in result
 
-    @pytest.mark.asyncio
     async def test_generate_code(self):
         """코드 생성 테스트"""
         client = ClaudeClient()
@@ -104,7 +94,6 @@ class TestClaudeService:
 class TestGeminiService:
     """Gemini 서비스 테스트"""
 
-    @pytest.mark.asyncio
     async def test_health_check(self):
         """헬스 체크 테스트"""
         client = GeminiClient()
@@ -114,7 +103,6 @@ class TestGeminiService:
             assert result["status"] == "healthy"
             assert result["service"] == "gemini"
 
-    @pytest.mark.asyncio
     async def test_analyze(self):
         """분석 테스트"""
         client = GeminiClient()
@@ -126,7 +114,15 @@ class TestGeminiService:
             assert "findings" in result
             assert "summary" in result
 
-    @pytest.mark.asyncio
+    async def test_analyze_large_content(self):
+        """대용량 분석 테스트 (프로세스 풀 경로)"""
+        client = GeminiClient()
+        async with client.session():
+            result = await client.analyze(content="x" * 200_000, analysis_type="code")
+
+            assert result["content_length"] == 200_000
+            assert result["findings"]
+
     async def test_research(self):
         """리서치 테스트"""
         client = GeminiClient()
@@ -136,7 +132,6 @@ class TestGeminiService:
             assert "results" in result
             assert "query" in result
 
-    @pytest.mark.asyncio
     async def test_review_code(self):
         """코드 리뷰 테스트"""
         client = GeminiClient()
@@ -150,7 +145,6 @@ class TestGeminiService:
 class TestCodexService:
     """Codex 서비스 테스트"""
 
-    @pytest.mark.asyncio
     async def test_health_check(self):
         """헬스 체크 테스트"""
         client = CodexClient()
@@ -160,7 +154,6 @@ class TestCodexService:
             assert result["status"] == "healthy"
             assert result["service"] == "codex"
 
-    @pytest.mark.asyncio
     async def test_execute_allowed(self):
         """허용된 명령 실행 테스트"""
         client = CodexClient()
@@ -170,7 +163,6 @@ class TestCodexService:
             assert result["success"] is True
             assert "Hello World" in result["stdout"]
 
-    @pytest.mark.asyncio
     async def test_execute_ls(self):
         """ls 명령 테스트"""
         client = CodexClient()
@@ -180,7 +172,6 @@ class TestCodexService:
             assert result["success"] is True
             assert result["exit_code"] == 0
 
-    @pytest.mark.asyncio
     async def test_execute_blocked(self):
         """차단된 명령 테스트"""
         client = CodexClient()
@@ -196,7 +187,6 @@ class TestCodexService:
 class TestMultiServiceWorkflow:
     """멀티 서비스 워크플로우 테스트"""
 
-    @pytest.mark.asyncio
     async def test_full_workflow(self):
         """전체 워크플로우 테스트"""
         claude = ClaudeClient()
@@ -225,7 +215,6 @@ class TestMultiServiceWorkflow:
         finally:
             await asyncio.gather(claude.disconnect(), gemini.disconnect(), codex.disconnect())
 
-    @pytest.mark.asyncio
     async def test_parallel_requests(self):
         """병렬 요청 테스트"""
         clients = [ClaudeClient(), GeminiClient(), CodexClient()]
@@ -252,7 +241,6 @@ class TestMultiServiceWorkflow:
 class TestConnectionHandling:
     """연결 처리 테스트"""
 
-    @pytest.mark.asyncio
     async def test_reconnect(self):
         """재연결 테스트"""
         client = ClaudeClient()
@@ -269,7 +257,6 @@ class TestConnectionHandling:
 
         assert result1["status"] == result2["status"]
 
-    @pytest.mark.asyncio
     async def test_context_manager(self):
         """컨텍스트 매니저 테스트"""
         async with ClaudeClient().session() as client:
@@ -279,7 +266,6 @@ class TestConnectionHandling:
         # 세션 종료 후 연결 확인
         assert not client.is_connected
 
-    @pytest.mark.asyncio
     async def test_connection_refused(self):
         """연결 거부 테스트"""
         config = ConnectionConfig(host="127.0.0.1", port=59999)  # 존재하지 않는 포트
@@ -1,10 +1,4 @@
 import asyncio
-import sys
-from pathlib import Path
-
-import pytest
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from gateway.load_balancer import (
     LeastConnectionsStrategy,
@@ -183,7 +177,6 @@ class TestLeastResponseTimeStrategy:
 
 
 class TestLoadBalancer:
-    @pytest.mark.asyncio
     async def test_add_endpoint(self):
         lb = LoadBalancer("test")
 
@@ -192,7 +185,6 @@ class TestLoadBalancer:
         assert len(lb._endpoints) == 1
         assert lb._endpoints[0].address == "127.0.0.1:5000"
 
-    @pytest.mark.asyncio
     async def test_remove_endpoint(self):
         lb = LoadBalancer("test")
         lb.add_endpoint("127.0.0.1", 5000)
@@ -203,7 +195,6 @@ class TestLoadBalancer:
         assert len(lb._endpoints) == 1
         assert lb._endpoints[0].port == 5001
 
-    @pytest.mark.asyncio
     async def test_get_endpoint_uses_strategy(self):
         lb = LoadBalancer("test", RoundRobinStrategy())
         lb.add_endpoint("127.0.0.1", 5000)
@@ -215,7 +206,6 @@ class TestLoadBalancer:
         assert ep1.port == 5000
         assert ep2.port == 5001
 
-    @pytest.mark.asyncio
     async def test_record_success_updates_endpoint(self):
         lb = LoadBalancer("test")
         lb.add_endpoint("127.0.0.1", 5000)
@@ -226,7 +216,6 @@ class TestLoadBalancer:
         assert endpoint.success_count == 1
         assert endpoint.avg_response_time == 1.5
 
-    @pytest.mark.asyncio
     async def test_record_failure_updates_endpoint(self):
         lb = LoadBalancer("test")
         lb.add_endpoint("127.0.0.1", 5000)
@@ -236,7 +225,6 @@ class TestLoadBalancer:
 
         assert endpoint.failure_count == 1
 
-    @pytest.mark.asyncio
     async def test_get_stats(self):
         lb = LoadBalancer("test")
         lb.add_endpoint("127.0.0.1", 5000)
@@ -250,7 +238,6 @@ class TestLoadBalancer:
         assert stats["healthy_endpoints"] == 1
         assert len(stats["endpoints"]) == 2
 
-    @pytest.mark.asyncio
     async def test_start_and_stop(self):
         lb = LoadBalancer("test", health_check_interval=0.1)
 
@@ -266,7 +253,6 @@ class TestLoadBalancer:
 
 
 class TestLoadBalancerHealthCheck:
-    @pytest.mark.asyncio
     async def test_health_check_updates_endpoint_status(self):
         lb = LoadBalancer("test", health_check_interval=0.1)
         lb.add_endpoint("127.0.0.1", 5000)
@@ -288,7 +274,6 @@ class TestLoadBalancerHealthCheck:
 
 
 class TestMultiServiceLoadBalancer:
-    @pytest.mark.asyncio
     async def test_add_and_get_service(self):
         multi_lb = MultiServiceLoadBalancer()
         lb = LoadBalancer("test")
@@ -299,7 +284,6 @@ class TestMultiServiceLoadBalancer:
 
         assert retrieved is lb
 
-    @pytest.mark.asyncio
     async def test_get_nonexistent_returns_none(self):
         multi_lb = MultiServiceLoadBalancer()
 
@@ -307,7 +291,6 @@ class TestMultiServiceLoadBalancer:
 
         assert retrieved is None
 
-    @pytest.mark.asyncio
     async def test_start_all(self):
         multi_lb = MultiServiceLoadBalancer()
 
@@ -320,7 +303,6 @@ class TestMultiServiceLoadBalancer:
         await multi_lb.start_all()
         await multi_lb.stop_all()
 
-    @pytest.mark.asyncio
     async def test_get_all_stats(self):
         multi_lb = MultiServiceLoadBalancer()
 
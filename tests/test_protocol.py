@@ -0,0 +1,153 @@
+import json
+import os
+
+import pytest
+
+from services import protocol
+from services.protocol import ErrorCode, JsonRpcRequest, JsonRpcResponse, MessageFramer
+
+
+class TestMessageFramer:
+    def test_encode_decode_roundtrip(self):
+        data = {"jsonrpc": "2.0", "id": "1", "result": {"text": "한글", "items": (1, 2.5, None)}}
+
+        frame = MessageFramer.encode(data)
+        length = MessageFramer.decode_header(frame[: MessageFramer.HEADER_SIZE])
+        payload = frame[MessageFramer.HEADER_SIZE :]
+
+        assert length == len(payload)
+        decoded = MessageFramer.decode_payload(payload)
+        assert decoded["result"] == {"text": "한글", "items": [1, 2.5, None]}
+
+    def test_header_is_big_endian_uint32(self):
+        header = MessageFramer.encode_header(258)
+
+        assert header == b"\x00\x00\x01\x02"
+        assert MessageFramer.decode_header(bytearray(header)) == 258
+        assert MessageFramer.decode_header(memoryview(header)) == 258
+
+    def test_decode_header_rejects_wrong_size(self):
+        with pytest.raises(ValueError):
+            MessageFramer.decode_header(b"\x00\x01")
+
+    def test_encode_passes_bytes_through(self):
+        data = b'{"id":"1"}'
+        header, payload = MessageFramer.encode_parts(data)
+
+        assert payload is data
+        assert MessageFramer.decode_header(header) == len(payload)
+
+    def test_encode_into_appends_frames(self):
+        buffer = bytearray()
+        MessageFramer.encode_into(buffer, {"id": "1"})
+        MessageFramer.encode_into(buffer, {"id": "2"})
+
+        view = memoryview(buffer)
+        ids = []
+        while view:
+            length = MessageFramer.decode_header(view[: MessageFramer.HEADER_SIZE])
+            end = MessageFramer.HEADER_SIZE + length
+            ids.append(MessageFramer.decode_payload(view[MessageFramer.HEADER_SIZE : end])["id"])
+            view = view[end:]
+
+        assert ids == ["1", "2"]
+
+    def test_payload_is_readable_by_stdlib_json(self):
+        data = {"jsonrpc": "2.0", "id": "1", "result": {"text": "한글", "n": 1.5}}
+
+        frame = MessageFramer.encode(data)
+
+        assert isinstance(frame, bytes)
+        assert json.loads(frame[MessageFramer.HEADER_SIZE :]) == data
+        assert MessageFramer.decode_payload(json.dumps(data).encode("utf-8")) == data
+
+    def test_decode_invalid_payload_raises(self):
+        with pytest.raises(ValueError):
+            MessageFramer.decode_payload(b"{not json")
+
+
+class TestJsonRpcMessages:
+    def test_request_to_bytes_roundtrip(self):
+        request = JsonRpcRequest(method="analyze", params={"content": "x"}, id="req-1")
+
+        decoded = MessageFramer.decode_payload(request.to_bytes())
+
+        assert JsonRpcRequest.from_dict(decoded) == request
+
+    def test_request_ids_are_unique(self):
+        ids = {JsonRpcRequest(method="m").id for _ in range(1000)}
+
+        assert len(ids) == 1000
+
+    def test_from_dict_keeps_given_id(self):
+        assert JsonRpcRequest.from_dict({"method": "m", "id": "abc"}).id == "abc"
+        assert JsonRpcRequest.from_dict({"method": "m"}).id
+
+    def test_acquire_keeps_client_method_as_given(self):
+        method = "".join(["unknown_", "method"])
+        request = JsonRpcRequest.acquire({"method": method, "id": "req-8"})
+
+        assert request.method is method
+        JsonRpcRequest.release(request)
+
+    def test_request_to_dict_shares_params(self):
+        params = {"nested": {"key": [1, 2]}}
+        request = JsonRpcRequest(method="process", params=params, id="req-2")
+
+        data = request.to_dict()
+
+        assert data == {"jsonrpc": "2.0", "method": "process", "params": params, "id": "req-2"}
+        assert data["params"] is params
+
+    def test_response_to_bytes_roundtrip(self):
+        response = JsonRpcResponse.success("req-1", {"ok": True})
+
+        decoded = MessageFramer.decode_payload(response.to_bytes())
+
+        assert decoded == {"jsonrpc": "2.0", "id": "req-1", "result": {"ok": True}}
+
+    def test_response_to_dict_shares_result(self):
+        result = {"items": [1, 2]}
+
+        data = JsonRpcResponse.success("req-3", result).to_dict()
+
+        assert data["result"] is result
+
+    def test_error_response_to_dict(self):
+        response = JsonRpcResponse.create_error("req-4", -32601, "Method not found")
+
+        assert response.to_dict() == {
+            "jsonrpc": "2.0",
+            "id": "req-4",
+            "error": {"code": -32601, "message": "Method not found"},
+        }
+
+    def test_request_ids_differ_after_fork(self):
+        parent_id = JsonRpcRequest(method="m").id
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - 자식 프로세스
+            os.write(write_fd, JsonRpcRequest(method="m").id.encode())
+            os._exit(0)
+        os.close(write_fd)
+        os.waitpid(pid, 0)
+        child_id = os.read(read_fd, 256).decode()
+        os.close(read_fd)
+
+        assert child_id
+        assert not child_id.startswith(protocol._proc_prefix)
+        assert child_id != parent_id
+
+    def test_error_response_to_bytes_matches_to_dict(self):
+        for code in (-32601, -32600):
+            response = JsonRpcResponse.create_error("req-5", code, "Bad request")
+
+            assert json.loads(response.to_bytes()) == response.to_dict()
+
+        for code in ErrorCode:
+            fixed = JsonRpcResponse.create_error("req-7", code, protocol._ERROR_MESSAGES[code])
+
+            assert json.loads(fixed.to_bytes()) == fixed.to_dict()
+
+        with_data = JsonRpcResponse.create_error("req-6", -32603, "Boom", data={"k": 1})
+        assert json.loads(with_data.to_bytes()) == with_data.to_dict()
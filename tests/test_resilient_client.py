@@ -1,10 +1,5 @@
-import sys
-from pathlib import Path
-
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from clients.resilient_client import (
     ResilienceConfig,
     ResilientClaudeClient,
@@ -101,7 +96,6 @@ class TestResilientGrpcClient:
 
         assert client._circuit_breaker is None
 
-    @pytest.mark.asyncio
     async def test_connect_creates_channel(self):
         config = ResilientClientConfig()
         client = ResilientGrpcClient(config)
@@ -114,7 +108,6 @@ class TestResilientGrpcClient:
 
         await client.disconnect()
 
-    @pytest.mark.asyncio
     async def test_connect_returns_true_if_already_connected(self):
         config = ResilientClientConfig()
         client = ResilientGrpcClient(config)
@@ -126,7 +119,6 @@ class TestResilientGrpcClient:
 
         await client.disconnect()
 
-    @pytest.mark.asyncio
     async def test_disconnect_closes_channel(self):
         config = ResilientClientConfig()
         client = ResilientGrpcClient(config)
@@ -137,7 +129,6 @@ class TestResilientGrpcClient:
         assert client.is_connected is False
         assert client.channel is None
 
-    @pytest.mark.asyncio
     async def test_session_context_manager(self):
         config = ResilientClientConfig()
         client = ResilientGrpcClient(config)
@@ -173,7 +164,6 @@ class TestResilientClaudeClient:
         assert client.config.host == "localhost"
         assert client.config.port == 9000
 
-    @pytest.mark.asyncio
     async def test_stub_property(self):
         client = ResilientClaudeClient()
         await client.connect()
@@ -192,7 +182,6 @@ class TestResilientGeminiClient:
         assert client.config.port == 5012
         assert client.config.service_name == "gemini"
 
-    @pytest.mark.asyncio
     async def test_stub_property(self):
         client = ResilientGeminiClient()
         await client.connect()
@@ -211,7 +200,6 @@ class TestResilientCodexClient:
         assert client.config.port == 5013
         assert client.config.service_name == "codex"
 
-    @pytest.mark.asyncio
     async def test_stub_property(self):
         client = ResilientCodexClient()
         await client.connect()
@@ -273,9 +261,27 @@ class TestResilientClientInterceptors:
 
         assert len(client._interceptors) == 0
 
+    def test_native_retry_replaces_retry_interceptor(self):
+        config = ResilientClientConfig()
+        config.resilience.retry_native = True
+
+        client = ResilientGrpcClient(config)
+
+        assert len(client._interceptors) == 2
+        assert client._service_config["methodConfig"][0]["retryPolicy"]["maxAttempts"] == 4
+
+    def test_native_retry_falls_back_for_unsupported_policy(self):
+        config = ResilientClientConfig()
+        config.resilience.retry_native = True
+        config.resilience.retry_max_attempts = 8
+
+        client = ResilientGrpcClient(config)
+
+        assert len(client._interceptors) == 3
+        assert client._service_config is None
+
 
 class TestResilientClientMetrics:
-    @pytest.mark.asyncio
     async def test_metrics_include_circuit_breaker_state(self):
         client = ResilientClaudeClient()
 
@@ -285,7 +291,6 @@ class TestResilientClientMetrics:
         assert "state" in metrics["circuit_breaker"]
         assert metrics["circuit_breaker"]["state"] == "closed"
 
-    @pytest.mark.asyncio
     async def test_metrics_include_timeout_info(self):
         client = ResilientClaudeClient()
 
@@ -293,7 +298,6 @@ class TestResilientClientMetrics:
 
         assert "timeout" in metrics
 
-    @pytest.mark.asyncio
     async def test_metrics_include_fallback_cache_stats(self):
         client = ResilientClaudeClient()
 
@@ -1,11 +1,6 @@
-import sys
-from pathlib import Path
-
 import pytest
 from grpc import StatusCode
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from services.interceptors.retry import RetryInterceptor, RetryPolicy
 
 
@@ -43,6 +38,14 @@ class TestRetryPolicy:
         assert StatusCode.ABORTED in policy.retryable_status_codes
         assert StatusCode.NOT_FOUND not in policy.retryable_status_codes
 
+    def test_unavailable_can_be_excluded(self):
+        policy = RetryPolicy(retryable_status_codes={StatusCode.ABORTED})
+        interceptor = RetryInterceptor(policy)
+
+        assert isinstance(policy.retryable_status_codes, frozenset)
+        assert interceptor._is_retryable(StatusCode.UNAVAILABLE) is False
+        assert interceptor._is_retryable(StatusCode.ABORTED) is True
+
 
 class TestRetryInterceptorBackoff:
     def test_backoff_calculation_without_jitter(self, retry_policy):
@@ -69,9 +72,40 @@ class TestRetryInterceptorBackoff:
 
         assert backoff == policy.max_backoff
 
+    def test_backoff_schedule_is_precomputed(self):
+        policy = RetryPolicy(max_attempts=4, initial_backoff=0.5, backoff_multiplier=2.0)
+
+        assert policy._backoff_schedule == (0.5, 1.0, 2.0, 4.0)
+        assert policy.base_backoff(5) == 16.0
+
+
+class TestRetryPolicyServiceConfig:
+    def test_service_config_matches_policy(self):
+        policy = RetryPolicy(max_attempts=3, initial_backoff=0.5, max_backoff=4.0)
+
+        retry = policy.to_service_config()["methodConfig"][0]["retryPolicy"]
+
+        assert retry["maxAttempts"] == 3
+        assert retry["initialBackoff"] == "0.5s"
+        assert retry["maxBackoff"] == "4s"
+        assert "UNAVAILABLE" in retry["retryableStatusCodes"]
+
+    def test_service_config_formats_sub_millisecond_backoff(self):
+        policy = RetryPolicy(initial_backoff=0.00001, max_backoff=0.0005)
+
+        retry = policy.to_service_config()["methodConfig"][0]["retryPolicy"]
+
+        assert retry["initialBackoff"] == "0.00001s"
+        assert retry["maxBackoff"] == "0.0005s"
+
+    def test_service_config_unavailable_below_nanosecond_backoff(self):
+        assert RetryPolicy(initial_backoff=1e-10).to_service_config() is None
+
+    def test_service_config_unavailable_for_too_many_attempts(self):
+        assert RetryPolicy(max_attempts=6).to_service_config() is None
+
 
 class TestRetryInterceptorRetryLogic:
-    @pytest.mark.asyncio
     async def test_no_retry_on_success(
         self, retry_interceptor, mock_call_details, mock_success_continuation
     ):
@@ -84,7 +118,6 @@ class TestRetryInterceptorRetryLogic:
         assert result["status"] == "success"
         assert retry_interceptor._total_retries == 0
 
-    @pytest.mark.asyncio
     async def test_retries_on_retryable_error(
         self, retry_interceptor, mock_call_details, mock_intermittent_continuation
     ):
@@ -100,7 +133,6 @@ class TestRetryInterceptorRetryLogic:
         assert result["call_number"] == 3
         assert retry_interceptor._total_retries == 2
 
-    @pytest.mark.asyncio
     async def test_exhausts_retries_on_persistent_failure(
         self, mock_call_details, mock_failure_continuation, mock_grpc_error
     ):
@@ -117,7 +149,6 @@ class TestRetryInterceptorRetryLogic:
 
         assert interceptor._total_retries == 2
 
-    @pytest.mark.asyncio
     async def test_no_retry_on_non_retryable_error(
         self, retry_interceptor, mock_call_details, mock_failure_continuation
     ):
@@ -132,7 +163,6 @@ class TestRetryInterceptorRetryLogic:
 
         assert retry_interceptor._total_retries == 0
 
-    @pytest.mark.asyncio
     async def test_successful_retry_increments_counter(
         self, mock_call_details, mock_intermittent_continuation
     ):
@@ -150,7 +180,6 @@ class TestRetryInterceptorRetryLogic:
 
 
 class TestRetryInterceptorCallback:
-    @pytest.mark.asyncio
     async def test_on_retry_callback_is_called(
         self, mock_call_details, mock_intermittent_continuation
     ):
@@ -175,7 +204,6 @@ class TestRetryInterceptorCallback:
 
 
 class TestRetryInterceptorMetrics:
-    @pytest.mark.asyncio
     async def test_get_metrics(self, mock_call_details, mock_intermittent_continuation):
         policy = RetryPolicy(max_attempts=3, initial_backoff=0.01, jitter=0.0)
         interceptor = RetryInterceptor(policy)
@@ -195,7 +223,6 @@ class TestRetryInterceptorMetrics:
 
 
 class TestRetryInterceptorStatusCodes:
-    @pytest.mark.asyncio
     async def test_retries_unavailable(self, mock_call_details, mock_intermittent_continuation):
         policy = RetryPolicy(max_attempts=3, initial_backoff=0.01, jitter=0.0)
         interceptor = RetryInterceptor(policy)
@@ -209,7 +236,6 @@ class TestRetryInterceptorStatusCodes:
 
         assert result["status"] == "success"
 
-    @pytest.mark.asyncio
     async def test_retries_deadline_exceeded(
         self, mock_call_details, mock_intermittent_continuation
     ):
@@ -225,7 +251,6 @@ class TestRetryInterceptorStatusCodes:
 
         assert result["status"] == "success"
 
-    @pytest.mark.asyncio
     async def test_retries_resource_exhausted(
         self, mock_call_details, mock_intermittent_continuation
     ):
@@ -1,12 +1,9 @@
 import asyncio
-import sys
+import json
 from dataclasses import dataclass
-from pathlib import Path
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from services.streaming_checkpoint import (
     ResumableStreamWrapper,
     StreamCheckpoint,
@@ -77,14 +74,12 @@ class TestStreamState:
 
 
 class TestStreamCheckpointManager:
-    @pytest.mark.asyncio
     async def test_start_stream_creates_state(self, checkpoint_manager):
         state = await checkpoint_manager.start_stream("stream-1")
 
         assert state.stream_id == "stream-1"
         assert state.completed is False
 
-    @pytest.mark.asyncio
     async def test_checkpoint_at_interval(self, checkpoint_manager):
         await checkpoint_manager.start_stream("stream-1")
 
@@ -96,7 +91,6 @@ class TestStreamCheckpointManager:
         assert cp2 is None
         assert cp3 is not None
 
-    @pytest.mark.asyncio
     async def test_checkpoint_at_100_percent(self, checkpoint_manager):
         await checkpoint_manager.start_stream("stream-1")
 
@@ -104,7 +98,15 @@ class TestStreamCheckpointManager:
 
         assert cp is not None
 
-    @pytest.mark.asyncio
+    async def test_checkpoint_on_state(self, checkpoint_manager):
+        state = await checkpoint_manager.start_stream("stream-1")
+
+        cp = await checkpoint_manager.checkpoint_on_state(state, 2, "msg2", 30.0)
+
+        assert cp.stream_id == "stream-1"
+        assert state.last_checkpoint is cp
+        assert state.total_messages == 3
+
     async def test_get_resume_point(self, checkpoint_manager):
         await checkpoint_manager.start_stream("stream-1")
         await checkpoint_manager.checkpoint("stream-1", 0, "msg0", 10.0)
@@ -114,7 +116,6 @@ class TestStreamCheckpointManager:
 
         assert resume.last_sequence == 2
 
-    @pytest.mark.asyncio
     async def test_no_resume_point_for_completed_stream(self, checkpoint_manager):
         await checkpoint_manager.start_stream("stream-1")
         await checkpoint_manager.checkpoint("stream-1", 0, "msg0", 50.0)
@@ -124,7 +125,6 @@ class TestStreamCheckpointManager:
 
         assert resume is None
 
-    @pytest.mark.asyncio
     async def test_complete_stream(self, checkpoint_manager):
         await checkpoint_manager.start_stream("stream-1")
         await checkpoint_manager.complete_stream("stream-1")
@@ -133,7 +133,6 @@ class TestStreamCheckpointManager:
 
         assert state.completed is True
 
-    @pytest.mark.asyncio
     async def test_fail_stream(self, checkpoint_manager):
         await checkpoint_manager.start_stream("stream-1")
         await checkpoint_manager.fail_stream("stream-1", "Connection lost")
@@ -142,7 +141,6 @@ class TestStreamCheckpointManager:
 
         assert state.error == "Connection lost"
 
-    @pytest.mark.asyncio
     async def test_tracks_total_messages(self, checkpoint_manager):
         await checkpoint_manager.start_stream("stream-1")
         await checkpoint_manager.checkpoint("stream-1", 0, "msg", 10.0)
@@ -153,7 +151,6 @@ class TestStreamCheckpointManager:
 
         assert state.total_messages == 10
 
-    @pytest.mark.asyncio
     async def test_get_stats(self, checkpoint_manager):
         await checkpoint_manager.start_stream("stream-1")
         await checkpoint_manager.start_stream("stream-2")
@@ -168,7 +165,6 @@ class TestStreamCheckpointManager:
 
 
 class TestStreamCheckpointManagerLimits:
-    @pytest.mark.asyncio
     async def test_evicts_oldest_when_max_reached(self):
         manager = StreamCheckpointManager(max_streams=2)
 
@@ -184,7 +180,21 @@ class TestStreamCheckpointManagerLimits:
         assert state1 is None
         assert state3 is not None
 
-    @pytest.mark.asyncio
+    async def test_restarted_stream_counts_as_newest(self):
+        manager = StreamCheckpointManager(max_streams=3)
+
+        await manager.start_stream("stream-1")
+        await manager.start_stream("stream-2")
+        await manager.start_stream("stream-3")
+        await manager.start_stream("stream-1")
+
+        assert manager.get_stats()["total_streams"] == 3
+
+        await manager.start_stream("stream-4")
+
+        assert await manager.get_state("stream-1") is not None
+        assert await manager.get_state("stream-2") is None
+
     async def test_cleans_expired_streams(self):
         manager = StreamCheckpointManager(ttl=0.05)
 
@@ -198,9 +208,92 @@ class TestStreamCheckpointManagerLimits:
         assert old_state is None
         assert new_state is not None
 
+    async def test_streams_in_other_shards_are_not_blocked(self, checkpoint_manager):
+        shard = checkpoint_manager._shard("stream-1")
+        other = next(
+            f"stream-{i}"
+            for i in range(2, 100)
+            if checkpoint_manager._shard(f"stream-{i}") != shard
+        )
+        await checkpoint_manager.start_stream(other)
+
+        async with checkpoint_manager._shard_locks[shard]:
+            cp = await asyncio.wait_for(checkpoint_manager.checkpoint(other, 0, "msg", 10.0), 1.0)
+
+        assert cp is not None
+
+    async def test_non_checkpoint_messages_skip_the_lock(self, checkpoint_manager):
+        await checkpoint_manager.start_stream("stream-1")
+        shard = checkpoint_manager._shard("stream-1")
+
+        async with checkpoint_manager._shard_locks[shard]:
+            cp = await asyncio.wait_for(checkpoint_manager.checkpoint("stream-1", 1, "m", 5.0), 1.0)
+
+        state = await checkpoint_manager.get_state("stream-1")
+        assert cp is None
+        assert state.total_messages == 2
+
+    async def test_checkpoint_history_is_bounded(self, checkpoint_manager):
+        from services.streaming_checkpoint import MAX_CHECKPOINTS_PER_STREAM
+
+        await checkpoint_manager.start_stream("stream-1")
+        for seq in range(0, 100, 2):
+            await checkpoint_manager.checkpoint("stream-1", seq, f"msg{seq}", 50.0)
+
+        state = await checkpoint_manager.get_state("stream-1")
+        assert len(state.checkpoints) == MAX_CHECKPOINTS_PER_STREAM
+        assert state.last_checkpoint.last_sequence == 98
+
+
+class TestAdaptiveCheckpointInterval:
+    async def test_fast_stream_checkpoints_less_often(self):
+        manager = StreamCheckpointManager(checkpoint_interval=2, checkpoint_target_seconds=1.0)
+        await manager.start_stream("fast")
+
+        checkpoints = [await manager.checkpoint("fast", seq, "msg", 50.0) for seq in range(1, 1001)]
+
+        saved = sum(1 for cp in checkpoints if cp is not None)
+        assert 2 <= saved < 100
+
+    async def test_slow_stream_checkpoints_on_wall_clock(self):
+        manager = StreamCheckpointManager(checkpoint_interval=10, checkpoint_target_seconds=0.02)
+        await manager.start_stream("slow")
+
+        first = await manager.checkpoint("slow", 1, "msg", 10.0)
+        await asyncio.sleep(0.03)
+        second = await manager.checkpoint("slow", 2, "msg", 20.0)
+        third = await manager.checkpoint("slow", 3, "msg", 30.0)
+
+        assert first is not None
+        assert second is not None
+        assert third is None
+
+
+class TestCheckpointPersistence:
+    async def test_batches_checkpoints_into_one_write(self, tmp_path):
+        path = tmp_path / "checkpoints.jsonl"
+        manager = StreamCheckpointManager(
+            checkpoint_interval=1,
+            persist_path=str(path),
+            persist_batch_size=3,
+            persist_max_delay=60,
+        )
+        await manager.start_stream("stream-1")
+
+        await manager.checkpoint("stream-1", 0, "msg0", 10.0)
+        await manager.checkpoint("stream-1", 1, "msg1", 20.0)
+        assert not path.exists()
+
+        await manager.checkpoint("stream-1", 2, "msg2", 30.0)
+        await manager.checkpoint("stream-1", 3, "msg3", 40.0)
+        lines = path.read_text().splitlines()
+        assert [json.loads(line)["last_sequence"] for line in lines] == [0, 1, 2]
+
+        await manager.flush()
+        assert len(path.read_text().splitlines()) == 4
+
 
 class TestStreamCheckpointMetadata:
-    @pytest.mark.asyncio
     async def test_checkpoint_with_metadata(self, checkpoint_manager):
         await checkpoint_manager.start_stream("stream-1")
 
@@ -210,6 +303,15 @@ class TestStreamCheckpointMetadata:
 
         assert cp.metadata == {"key": "value"}
 
+    async def test_checkpoints_without_metadata_share_empty_mapping(self, checkpoint_manager):
+        await checkpoint_manager.start_stream("stream-1")
+
+        cp1 = await checkpoint_manager.checkpoint("stream-1", 0, "msg", 10.0)
+        cp2 = await checkpoint_manager.checkpoint("stream-1", 2, "msg", 20.0)
+
+        assert cp1.metadata == {}
+        assert cp1.metadata is cp2.metadata
+
 
 @dataclass
 class MockStreamMessage:
@@ -218,7 +320,6 @@ class MockStreamMessage:
 
 
 class TestResumableStreamWrapper:
-    @pytest.mark.asyncio
     async def test_wraps_stream_and_yields_messages(self, checkpoint_manager):
         messages = [
             MockStreamMessage("msg1", 25.0),
@@ -244,7 +345,20 @@ class TestResumableStreamWrapper:
         assert len(received) == 4
         assert received[0].content == "msg1"
 
-    @pytest.mark.asyncio
+    async def test_checkpoints_plain_messages_as_strings(self, checkpoint_manager):
+        async def stream_factory():
+            for i in range(4):
+                yield i
+
+        wrapper = ResumableStreamWrapper("stream-1", checkpoint_manager, stream_factory)
+
+        received = [msg async for msg in wrapper]
+
+        state = await checkpoint_manager.get_state("stream-1")
+        assert received == [0, 1, 2, 3]
+        assert state.last_checkpoint.last_content == "3"
+        assert state.last_checkpoint.progress_percent == 0
+
     async def test_completes_stream_on_success(self, checkpoint_manager):
         messages = [MockStreamMessage("msg1", 100.0)]
 
@@ -264,7 +378,6 @@ class TestResumableStreamWrapper:
         state = await checkpoint_manager.get_state("stream-1")
         assert state.completed is True
 
-    @pytest.mark.asyncio
     async def test_fails_stream_on_error(self, checkpoint_manager):
         async def failing_stream():
             yield MockStreamMessage("msg1", 25.0)
@@ -283,7 +396,6 @@ class TestResumableStreamWrapper:
         state = await checkpoint_manager.get_state("stream-1")
         assert state.error is not None
 
-    @pytest.mark.asyncio
     async def test_resumes_from_checkpoint(self, checkpoint_manager):
         await checkpoint_manager.start_stream("stream-1")
         await checkpoint_manager.checkpoint("stream-1", 2, "resumed", 50.0)
@@ -317,7 +429,6 @@ class TestResumableStreamWrapper:
 
 
 class TestCreateResumableStream:
-    @pytest.mark.asyncio
     async def test_creates_wrapper(self):
         async def stream_factory():
             yield "msg"